@@ -0,0 +1,100 @@
+"""代幣信息增強引擎基準：上游數據已就緒（立即返回）時，單次增強的字段解析與格式化耗時。
+
+高頻與 premium 兩個 profile 走同一條代碼路徑，只是來源階段與字段優先級不同；
+這裡用與 api.py 相同結構的 profile（上游替換為內存數據），衡量引擎本身的開銷。
+
+用法：python bench/bench_enrichment.py [rounds=20000]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from enrichment import Profile, Source, enrich  # noqa: E402
+
+ES_SOURCE = {
+    "name": "Bench Token",
+    "symbol": "BENCH",
+    "created_at": 1735704000000,
+    "market_cap_usd": 2_350_000,
+    "price_usd": 0.00235,
+    "total_supply": 1_000_000_000,
+    "holder_info": {"holder_count": 1234, "top10_percent": 23.45},
+    "security_info": {
+        "dev_status": 1,
+        "risk_item": [
+            {"code": "PERMISSION_RENOUNCED", "riskStatus": "PASS"},
+            {"code": "NOT_PIKS", "riskStatus": "PASS"},
+            {"code": "LP_LOCKED", "riskStatus": "FAIL"},
+            {"code": "NO_BLACKLIST", "riskStatus": "PASS"},
+        ],
+    },
+    "social_info": {"twitter": "x.com/bench", "websites": ["bench.example"]},
+    "contract_info": {"creator": "BenchCreator1111111111111111111111111111111"},
+}
+SOLSCAN_META = {
+    "name": "Bench Token",
+    "symbol": "BENCH",
+    "price": 0.00236,
+    "supply": 1_000_000_000,
+    "holder": 1240,
+    "created_time": 1735704000,
+    "metadata": {"twitter": "https://x.com/bench", "website": "https://bench.example"},
+    "creator": "BenchCreator1111111111111111111111111111111",
+}
+SMART_MONEY_TREND = {"total_addr_amount": 5, "buy": []}
+
+
+def _static(value):
+    async def fetch(run):
+        return value
+    return fetch
+
+
+def build_profiles():
+    es = Source("es", _static(ES_SOURCE))
+    solscan = Source("solscan", _static(SOLSCAN_META))
+    smart_money = Source("smart_money", _static(SMART_MONEY_TREND))
+    balance = Source("rpc_balance", _static(0.0000123), default=0.0, requires=("creator",))
+    es_first = {
+        field: ("es", "solscan")
+        for field in ("name", "symbol", "price", "market_cap", "holders", "launch_ts", "twitter_url", "website_url")
+    }
+    es_first.update({
+        "creator": ("es",), "top10_holding": ("es",), "dev_status": ("es",), "risk_items": ("es",),
+        "dev_wallet_balance": ("rpc_balance",), "smart_money_trend": ("smart_money",),
+    })
+    solscan_first = {field: tuple(reversed(order)) if len(order) == 2 else order for field, order in es_first.items()}
+    solscan_first["price"] = ("input", "es", "solscan")
+    return {
+        "high_freq": Profile("high_freq", [[es], [smart_money, balance, solscan]], es_first),
+        "premium": Profile(
+            "premium", [[es, solscan, smart_money], [balance]], solscan_first, required={"solscan": ("symbol",)}
+        ),
+    }
+
+
+async def bench(profile: Profile, rounds: int) -> float:
+    inputs = {"price": 0.00237}
+    await enrich(profile, "GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump", inputs)  # 預熱
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await enrich(profile, "GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump", inputs)
+    return (time.perf_counter() - start) / rounds
+
+
+async def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # 基準只關心耗時，關閉每次增強的 INFO/WARNING 日誌
+    logging.disable(logging.WARNING)
+    print(f"rounds={rounds}")
+    for name, profile in build_profiles().items():
+        elapsed = await bench(profile, rounds)
+        print(f"{name:10s} {elapsed * 1_000_000:8.1f} us/token")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""消息渲染基準：一次推送扇出（16 個語言主題 + 每語言 N 個額外頻道）的渲染耗時。
+
+對比兩種策略：
+- per_target：每個目標各自調用 format_message / format_premium_message（舊行為）
+- cached：MessageRenderCache，同一 (模板類型, 語言) 只渲染一次
+
+用法：python bench/bench_render.py [extra_per_language=50] [rounds=20]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from templates import format_message, format_premium_message, MessageRenderCache  # noqa: E402
+from token_snapshot import TokenSnapshot  # noqa: E402
+
+LANGUAGES = ["zh", "en", "ko", "ch", "ru", "id", "ja", "pt", "fr", "es", "tr", "de", "it", "ar", "fa", "vn"]
+
+SAMPLE = TokenSnapshot(
+    token_address="GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump",
+    token_name="Bench Token",
+    token_symbol="BENCH",
+    chain="Solana",
+    price=0.00235,
+    market_cap=2_350_000,
+    holders=1234,
+    launch_ts=1735704000,
+    top10_holding=23.45,
+    dev_status=1,
+    dev_wallet_balance=1.23,
+    total_addr_amount=5,
+    security={"authority": True, "rug_pull": True, "burn_pool": False, "blacklist": True},
+    twitter_url="https://x.com/bench",
+    website_url="https://bench.example",
+    highlight_tag_codes=[1, 3],
+    market_cap_level=1,
+    open_time=int(time.time()) - 3600,
+)
+
+
+def build_targets(extra_per_language: int):
+    # 語言主題各一個，再加上每個語言 extra_per_language 個額外頻道
+    return list(LANGUAGES) + [lang for lang in LANGUAGES for _ in range(extra_per_language)]
+
+
+def run_per_target(targets, premium: bool) -> None:
+    render = format_premium_message if premium else format_message
+    for lang in targets:
+        try:
+            render(SAMPLE, lang)
+        except ValueError:
+            # 個別語言模板格式錯誤時與線上行為一致：該目標渲染失敗
+            pass
+
+
+def run_cached(targets, premium: bool) -> None:
+    cache = MessageRenderCache(SAMPLE, is_premium=premium)
+    for lang in targets:
+        try:
+            cache.get(lang)
+        except ValueError:
+            pass
+
+
+def bench(fn, targets, premium: bool, rounds: int) -> float:
+    fn(targets, premium)  # 預熱
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(targets, premium)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    extra_per_language = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    targets = build_targets(extra_per_language)
+    print(f"targets per push: {len(targets)} ({len(LANGUAGES)} languages, {extra_per_language} extra channels each), rounds={rounds}")
+    for premium in (False, True):
+        kind = "premium" if premium else "high_freq"
+        before = bench(run_per_target, targets, premium, rounds)
+        after = bench(run_cached, targets, premium, rounds)
+        print(
+            f"{kind:10s} per_target={before * 1000:8.2f} ms/push  cached={after * 1000:8.3f} ms/push  "
+            f"speedup={before / after if after else float('inf'):6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""模板渲染分配基準：每條消息的峰值臨時內存與耗時。
+
+測量 format_message / format_premium_message 以及 push_to_channel 讀取按鈕文案的路徑。
+在未引入模板註冊表/代幣快照的舊代碼上，按鈕文案退回 load_templates() 讀取，
+樣本退回舊版的 dict 格式（顯示字串與 JSON 欄位預先算好），便於前後對比。
+
+用法：python bench/bench_templates.py [iterations=2000]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import templates  # noqa: E402
+
+try:
+    from token_snapshot import TokenSnapshot
+except ImportError:
+    TokenSnapshot = None
+
+LANGUAGES = ["zh", "en", "ch", "ru", "id", "ja", "pt", "fr", "es", "tr", "de", "it", "ar", "fa", "vn"]
+
+SAMPLE_FIELDS = dict(
+    token_address="GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump",
+    token_name="Bench Token",
+    token_symbol="BENCH",
+    chain="Solana",
+    price=0.00235,
+    market_cap=2_350_000,
+    holders=1234,
+    launch_ts=1735704000,
+    top10_holding=23.45,
+    dev_status=1,
+    dev_wallet_balance=1.23,
+    total_addr_amount=5,
+    security={"authority": True, "rug_pull": True, "burn_pool": False, "blacklist": True},
+    twitter_url="https://x.com/bench",
+    website_url="https://bench.example",
+    highlight_tag_codes=[1, 3],
+    market_cap_level=1,
+    open_time=int(time.time()) - 3600,
+)
+
+
+def legacy_sample(fields):
+    """引入 TokenSnapshot 之前，format_message 接收的 dict 格式。"""
+    return {
+        "token_name": fields["token_name"],
+        "token_symbol": fields["token_symbol"],
+        "chain": fields["chain"],
+        "token_address": fields["token_address"],
+        "market_cap_display": "$ 2.35M",
+        "price_display": "0.00235",
+        "holders_display": "1,234",
+        "launch_time_display": "2025.01.01 12:00:00",
+        "total_addr_amount": str(fields["total_addr_amount"]),
+        "top10_holding_display": "23.45",
+        "top10_holding": fields["top10_holding"],
+        "dev_status": fields["dev_status"],
+        "dev_wallet_balance_display": "1.23",
+        "contract_security": json.dumps(fields["security"]),
+        "socials": json.dumps({
+            "twitter": True, "website": True, "telegram": False, "twitter_search": True,
+            "twitter_url": fields["twitter_url"], "website_url": fields["website_url"],
+        }),
+        "market_cap_level": fields["market_cap_level"],
+        "open_time": fields["open_time"],
+        "highlight_tag_codes": fields["highlight_tag_codes"],
+    }
+
+
+SAMPLE = TokenSnapshot(**SAMPLE_FIELDS) if TokenSnapshot is not None else legacy_sample(SAMPLE_FIELDS)
+
+
+def button_labels(language: str):
+    get_labels = getattr(templates, "get_button_labels", None)
+    if get_labels is not None:
+        labels = get_labels(language)
+        return labels.trade, labels.chart
+    # 舊路徑：與註冊表引入前的 push_to_channel 一致
+    all_templates = templates.load_templates()
+    lang_templates = all_templates.get(language, all_templates.get("en"))
+    return lang_templates.get("trade_button", "⚡️一键交易⬆️"), lang_templates.get("chart_button", "👉查K线⬆️")
+
+
+CASES = {
+    "format_message": lambda lang: templates.format_message(SAMPLE, lang),
+    "format_premium_message": lambda lang: templates.format_premium_message(SAMPLE, lang),
+    "button_labels": button_labels,
+}
+
+
+def measure_alloc(fn, iterations: int) -> float:
+    """返回每次調用的平均峰值臨時內存（bytes）。"""
+    peak_total = 0
+    tracemalloc.start()
+    try:
+        for i in range(iterations):
+            tracemalloc.reset_peak()
+            before_current, _ = tracemalloc.get_traced_memory()
+            fn(LANGUAGES[i % len(LANGUAGES)])
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before_current
+    finally:
+        tracemalloc.stop()
+    return peak_total / iterations
+
+
+def measure_time(fn, iterations: int) -> float:
+    for lang in LANGUAGES:
+        fn(lang)  # 預熱
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(LANGUAGES[i % len(LANGUAGES)])
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"iterations={iterations}, languages={len(LANGUAGES)}")
+    for name, fn in CASES.items():
+        peak = measure_alloc(fn, min(iterations, 500))
+        per_call = measure_time(fn, iterations)
+        print(f"{name:24s} peak_alloc={peak / 1024:8.1f} KiB/msg  time={per_call * 1e6:8.1f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""調度器分級評估基準：逐文檔路徑（evaluate_token_tiers / _passes_push_thresholds）與 NumPy 列式原型對比。
+
+列式原型只存在於本基準中，用於評估是否值得把整批 ES _source 轉為列再一次計算分級；
+合成文檔覆蓋 None、缺失欄位、數值字串、無法解析的字串、fdv / price×supply 市值回退與不同的成交額欄位名，
+計時前先校驗兩條路徑結果一致。需要 numpy（不在 requirements.txt 中，僅本基準使用）。
+
+開發機結果（兩次運行，取 200 輪最短耗時；10k 取 20 輪）：
+    docs      per_document    columnar       倍數
+    50        0.09-0.14 ms    0.10-0.20 ms   0.7-0.8x
+    100       0.18-0.20 ms    0.19-0.29 ms   0.7-1.0x
+    200       0.34-0.56 ms    0.35-0.50 ms   1.0-1.1x
+    10000     19.8-33.9 ms    16.6-23.9 ms   1.2-1.4x
+調度器每批最多 DETAIL_MAX_TOKENS_PER_CYCLE（預設 100）個文檔，此規模下列式沒有收益：
+耗時主要在從 dict 取值，比較運算本身很少，因此調度器保留逐文檔實現。
+
+用法：python bench/bench_tiers.py [docs=50,100,200,10000]
+"""
+import logging
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "1:bench")
+os.environ.setdefault("DATABASE_URI_TELEGRAM", "sqlite+aiosqlite://")
+
+import heat_scheduler as hs  # noqa: E402
+
+TIERS = [
+    ("TIER_1", 2_000_000, hs.TIER1_TXNS, hs.TIER1_VOL_USD),
+    ("TIER_2", 5_000_000, hs.TIER2_TXNS, hs.TIER2_VOL_USD),
+]
+# 與 _tier_from_market_cap / _passes_push_thresholds 一致：(市值門檻, 5分成交筆數, 5分成交額)，等級 = 序號 + 1
+PUSH_LEVELS = [
+    (2_000_000, hs.TIER1_TXNS, hs.TIER1_VOL_USD),
+    (5_000_000, hs.TIER2_TXNS, hs.TIER2_VOL_USD),
+]
+
+
+# ------------------------------------------------合成數據------------------------------------------------
+
+def _maybe(rng: random.Random, value, text_ratio: float = 0.04):
+    roll = rng.random()
+    if roll < 0.05:
+        return None
+    if roll < 0.06:
+        return "n/a"
+    if roll < 0.06 + text_ratio:
+        return str(value)
+    return value
+
+
+def synthetic_sources(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now_ms = int(time.time() * 1000)
+    volume_keys = list(hs._M5_VOLUME_KEYS)
+    sources = {}
+    for i in range(count):
+        address = f"Bench{i:06d}pump"
+        if rng.random() < 0.02:
+            sources[address] = None
+            continue
+        doc = {"address": address, "symbol": f"B{i}", "name": f"Bench {i}"}
+        if rng.random() > 0.03:
+            doc["created_at"] = _maybe(rng, now_ms - rng.randint(0, (hs.RECENT_TOKEN_DAYS + 3) * 86_400_000))
+        cap = rng.choice([0, rng.uniform(100_000, 10_000_000)])
+        shape = rng.random()
+        if shape < 0.6:
+            doc["market_cap_usd"] = _maybe(rng, cap)
+        elif shape < 0.8:
+            doc["market_cap_usd"] = 0
+            doc["fdv_usd"] = _maybe(rng, cap)
+        else:
+            doc["price_usd"] = _maybe(rng, cap / 1_000_000_000)
+            doc["total_supply"] = _maybe(rng, 1_000_000_000)
+        if rng.random() > 0.03:
+            market_info = {"m5_total_txns": _maybe(rng, rng.choice([rng.randint(0, 500), rng.uniform(0, 500)]))}
+            for key in rng.sample(volume_keys, rng.randint(0, len(volume_keys))):
+                market_info[key] = _maybe(rng, rng.uniform(0, 300_000))
+            doc["market_info"] = market_info
+        sources[address] = doc
+    return sources
+
+
+# ------------------------------------------------逐文檔（調度器實現）------------------------------------------------
+
+def per_document(sources):
+    matched = {}
+    for address, src in sources.items():
+        if not src:
+            continue
+        tiers = hs.evaluate_token_tiers(src)
+        if tiers:
+            matched[address] = tiers
+    candidates = [a for a, src in sources.items() if src and hs._passes_push_thresholds(src)]
+    return matched, candidates
+
+
+# ------------------------------------------------列式原型------------------------------------------------
+
+def _parse_float(value) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
+
+
+def _float_column(values) -> np.ndarray:
+    """None 與無法解析的值為 NaN；含非數值元素時只對這些元素逐個解析。"""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        return np.array(
+            [v if type(v) is float or type(v) is int else _parse_float(v) for v in values], dtype=np.float64
+        )
+
+
+def _zero_missing(column: np.ndarray) -> np.ndarray:
+    column[np.isnan(column)] = 0.0
+    return column
+
+
+def _first_present(market_info, keys):
+    for key in keys:
+        value = market_info.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _first_parsable(market_info, keys) -> float:
+    # 與 _get_m5_volume_usd 相同：跳過無法解析的欄位，空值（0/""）視為 0
+    for key in keys:
+        value = market_info.get(key)
+        if value is None:
+            continue
+        try:
+            return float(value or 0)
+        except (TypeError, ValueError, OverflowError):
+            continue
+    return math.nan
+
+
+def columnar(sources):
+    addresses = [a for a, src in sources.items() if src]
+    docs = [sources[a] for a in addresses]
+    market_infos = [d.get("market_info") or {} for d in docs]
+
+    created_at = np.trunc(_zero_missing(_float_column([d.get("created_at") for d in docs])))
+
+    market_cap = _zero_missing(_float_column([d.get("market_cap_usd") for d in docs]))
+    fallback = np.flatnonzero(~(market_cap > 0))
+    if fallback.size:
+        rest = [docs[i] for i in fallback]
+        fdv = _zero_missing(_float_column([d.get("fdv_usd") for d in rest]))
+        price = _zero_missing(_float_column([d.get("price_usd") for d in rest]))
+        supply = _zero_missing(_float_column([d.get("total_supply") for d in rest]))
+        market_cap[fallback] = np.where(fdv > 0, fdv, price * supply)
+
+    txns = _zero_missing(_float_column([mi.get("m5_total_txns") for mi in market_infos]))
+    txns[~np.isfinite(txns)] = 0.0
+    txns = np.trunc(txns)
+
+    raw_volume = [_first_present(mi, hs._M5_VOLUME_KEYS) for mi in market_infos]
+    volume = _float_column(raw_volume)
+    for idx in np.flatnonzero(np.isnan(volume)):
+        if raw_volume[idx] is not None:
+            volume[idx] = _first_parsable(market_infos[idx], hs._M5_VOLUME_KEYS)
+    volume = _zero_missing(volume)
+
+    now_ms = int(hs._now_ts() * 1000)
+    recent = (created_at > 0) & ((now_ms - created_at) <= hs.RECENT_TOKEN_DAYS * 24 * 3600 * 1000)
+    matched = {}
+    for name, cap, tx_thr, vol_thr in TIERS:
+        mask = recent & (market_cap >= cap) & (txns >= tx_thr) & (volume >= vol_thr)
+        for idx in np.flatnonzero(mask):
+            matched.setdefault(addresses[idx], []).append(name)
+
+    level = np.searchsorted(np.array([cap for cap, _, _ in PUSH_LEVELS]), market_cap, side="right")
+    req_txns = np.array([np.inf] + [t for _, t, _ in PUSH_LEVELS])[level]
+    req_volume = np.array([np.inf] + [v for _, _, v in PUSH_LEVELS])[level]
+    push = (level > 0) & (txns >= req_txns) & (volume >= req_volume)
+    return matched, [addresses[idx] for idx in np.flatnonzero(push)]
+
+
+# ------------------------------------------------計時------------------------------------------------
+
+def timed(fn, sources, rounds: int) -> float:
+    """取 rounds 次中的最短耗時，減少共享機器上的抖動。"""
+    fn(sources)  # 預熱
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(sources)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1].split(",")] if len(sys.argv) > 1 else [50, 100, 200, 10000]
+    logging.disable(logging.WARNING)
+    print(f"{'docs':>6s} {'per_document':>14s} {'columnar':>12s}")
+    for count in sizes:
+        sources = synthetic_sources(count)
+        expected, got = per_document(sources), columnar(sources)
+        if expected != got:
+            diff = (
+                {a for a in set(expected[0]) | set(got[0]) if expected[0].get(a) != got[0].get(a)}
+                | (set(expected[1]) ^ set(got[1]))
+            )
+            raise SystemExit(f"結果不一致 docs={count}: {sorted(diff)[:10]}")
+        rounds = 20 if count >= 5000 else 200
+        per_doc = timed(per_document, sources, rounds)
+        batch = timed(columnar, sources, rounds)
+        print(f"{count:>6d} {per_doc * 1000:>11.2f} ms {batch * 1000:>9.2f} ms  ({per_doc / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from stage_timing import run_stage, format_timings
+from token_snapshot import TokenSnapshot
+
+logger = logging.getLogger(__name__)
+
+# ES risk_item 代碼到推送消息四類合約安全項的映射（任一對應代碼 PASS 則視為該類 True）
+RISK_CODE_CATEGORIES = {
+    # 權限/所有權相關
+    "PERMISSION_RENOUNCED": "authority",
+    "OWNER_CANNOT_CHANGE_BALANCE": "authority",
+    "OWNER_CANNOT_PAUSE_TRADING": "authority",
+    "TRANSFER_HOOK": "authority",
+    # 風險/跑路相關
+    "NOT_PIKS": "rug_pull",
+    "NO_INFLATION_DUMP": "rug_pull",
+    "TOKEN_CANNOT_SELF_DESTRUCT": "rug_pull",
+    # 鎖池/滑點不可變 等近似視為 burn_pool 類
+    "LP_LOCKED": "burn_pool",
+    "SLIPPAGE_IMMUTABLE": "burn_pool",
+    # 黑名單
+    "NO_BLACKLIST": "blacklist",
+}
+
+# 推送前必須取得（且 > 0）的易變字段
+VOLATILE_FIELDS = ("price", "market_cap", "holders")
+
+
+# ------------------------------------------------字段解析------------------------------------------------
+
+def _positive_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _positive_int(value: Any) -> Optional[int]:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _product(a: Any, b: Any) -> Optional[float]:
+    a, b = _positive_float(a), _positive_float(b)
+    return a * b if a is not None and b is not None else None
+
+
+def _text(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+def _url(value: Any) -> Optional[str]:
+    value = _text(value)
+    if value is None:
+        return None
+    return value if value.startswith(("http://", "https://")) else f"https://{value}"
+
+
+def _es_created_ts(src: Dict) -> Optional[int]:
+    created_ms = _positive_int(src.get("created_at"))
+    return created_ms // 1000 if created_ms else None
+
+
+def _es_website(src: Dict) -> Optional[str]:
+    websites = (src.get("social_info") or {}).get("websites") or []
+    return _url(websites[0]) if isinstance(websites, list) and websites else None
+
+
+def _es_top10(src: Dict) -> Optional[float]:
+    # 優先從 holder_info.top10_percent 取得，若無則嘗試 security_info.base_top_10_percent
+    raw = (src.get("holder_info") or {}).get("top10_percent")
+    if raw is None:
+        raw = (src.get("security_info") or {}).get("base_top_10_percent")
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        logger.warning("無法解析 top10 百分比")
+        return None
+
+
+def _es_risk_items(src: Dict) -> Dict[str, bool]:
+    risk_items: Dict[str, bool] = {}
+    for item in (src.get("security_info") or {}).get("risk_item") or []:
+        mapped = RISK_CODE_CATEGORIES.get(item.get("code"))
+        if mapped and item.get("riskStatus") == "PASS":
+            risk_items[mapped] = True
+    return risk_items
+
+
+# 字段 -> {數據源 -> 提取函數}；提取結果為 None 表示該來源無可用值，按優先級嘗試下一個來源
+FIELD_RESOLVERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "name": {
+        "es": lambda src: _text(src.get("name")),
+        "solscan": lambda sd: _text(sd.get("name")),
+    },
+    "symbol": {
+        "es": lambda src: _text(src.get("symbol")),
+        "solscan": lambda sd: _text(sd.get("symbol")),
+    },
+    "price": {
+        "input": lambda inputs: _positive_float(inputs.get("price")),
+        "es": lambda src: _positive_float(src.get("price_usd")),
+        "solscan": lambda sd: _positive_float(sd.get("price")),
+    },
+    "market_cap": {
+        # market_cap_usd → fdv_usd → price_usd * total_supply
+        "es": lambda src: (
+            _positive_float(src.get("market_cap_usd"))
+            or _positive_float(src.get("fdv_usd"))
+            or _product(src.get("price_usd"), src.get("total_supply"))
+        ),
+        "solscan": lambda sd: _positive_float(sd.get("market_cap")) or _product(sd.get("price"), sd.get("supply")),
+    },
+    "holders": {
+        "es": lambda src: _positive_int((src.get("holder_info") or {}).get("holder_count")),
+        "solscan": lambda sd: _positive_int(sd.get("holder")),
+    },
+    "launch_ts": {
+        "es": _es_created_ts,
+        "solscan": lambda sd: _positive_int(sd.get("created_time")),
+    },
+    "twitter_url": {
+        "es": lambda src: _url((src.get("social_info") or {}).get("twitter")),
+        "solscan": lambda sd: _url((sd.get("metadata") or {}).get("twitter")),
+    },
+    "website_url": {
+        "es": _es_website,
+        "solscan": lambda sd: _url((sd.get("metadata") or {}).get("website")),
+    },
+    "creator": {
+        "es": lambda src: _text((src.get("contract_info") or {}).get("creator")),
+        "solscan": lambda sd: _text(sd.get("creator")),
+    },
+    "top10_holding": {"es": _es_top10},
+    "dev_status": {"es": lambda src: (src.get("security_info") or {}).get("dev_status")},
+    "risk_items": {"es": _es_risk_items},
+    "dev_wallet_balance": {"rpc_balance": lambda balance: float(balance)},
+    "smart_money_trend": {"smart_money": lambda trend: trend or None},
+}
+
+
+# ------------------------------------------------增強引擎------------------------------------------------
+
+class Source:
+    """一個上游數據源：在所屬階段以獨立截止時間查詢，失敗或超時時結果為 default。
+
+    requires 列出查詢前必須已解析的字段（如餘額查詢依賴 creator）；
+    when 為可選條件，返回 False 時本次不查詢（如其他來源已補齊字段時跳過備援）。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[["EnrichmentRun"], Awaitable[Any]],
+        deadline: Optional[float] = None,
+        default: Any = None,
+        requires: Sequence[str] = (),
+        when: Optional[Callable[["EnrichmentRun"], bool]] = None,
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.deadline = deadline
+        self.default = default
+        self.requires = tuple(requires)
+        self.when = when
+
+
+class Profile:
+    """一組數據源的查詢階段與字段優先級。
+
+    phases 內的來源並行查詢，階段之間按順序執行；priorities 為 字段 -> 來源優先級；
+    required 為 來源 -> 必須存在的鍵，來源無數據或缺鍵時放棄本次增強；
+    finalize 在結果構建後執行（如 premium 亮點標籤）。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        phases: Sequence[Sequence[Source]],
+        priorities: Dict[str, Sequence[str]],
+        required: Optional[Dict[str, Sequence[str]]] = None,
+        finalize: Optional[Callable[["EnrichmentRun", TokenSnapshot], Awaitable[None]]] = None,
+    ):
+        unknown = [f for f in priorities if f not in FIELD_RESOLVERS]
+        if unknown:
+            raise ValueError(f"未知的增強字段: {unknown}")
+        self.name = name
+        self.phases = [list(phase) for phase in phases]
+        self.priorities = {field: tuple(order) for field, order in priorities.items()}
+        self.required = {source: tuple(keys) for source, keys in (required or {}).items()}
+        self.finalize = finalize
+
+
+class EnrichmentRun:
+    """單次增強的狀態：各來源的原始數據、已解析字段及其來源、各階段耗時。"""
+
+    def __init__(self, profile: Profile, token_address: str, inputs: Optional[Dict[str, Any]] = None):
+        self.profile = profile
+        self.token_address = token_address
+        self.data: Dict[str, Any] = {"input": inputs or {}}
+        self.values: Dict[str, Any] = {}
+        self.resolved_from: Dict[str, str] = {}
+        self.timings: Dict[str, float] = {}
+
+    def value(self, field: str, default: Any = None) -> Any:
+        value = self.values.get(field)
+        return default if value is None else value
+
+    def missing(self, fields: Iterable[str]) -> Set[str]:
+        return {f for f in fields if self.values.get(f) is None}
+
+    def resolve(self) -> None:
+        """按優先級為每個字段選取第一個有值的來源。"""
+        for field, order in self.profile.priorities.items():
+            resolvers = FIELD_RESOLVERS[field]
+            for source in order:
+                data = self.data.get(source)
+                extract = resolvers.get(source)
+                if data is None or extract is None:
+                    continue
+                try:
+                    value = extract(data)
+                except Exception as e:
+                    logger.warning(f"解析增強字段失敗: field={field}, source={source}, err={e}")
+                    continue
+                if value is not None:
+                    self.values[field] = value
+                    self.resolved_from[field] = source
+                    break
+
+    def should_fetch(self, source: Source) -> bool:
+        if self.missing(source.requires):
+            return False
+        return source.when is None or source.when(self)
+
+    def missing_required(self, source: str) -> bool:
+        keys = self.profile.required.get(source)
+        if keys is None:
+            return False
+        data = self.data.get(source)
+        return not data or any(data.get(k) is None for k in keys)
+
+
+def build_snapshot(run: EnrichmentRun) -> TokenSnapshot:
+    """由已解析字段構建代幣快照。"""
+    token_name = run.value("name") or run.value("symbol") or "Unknown"
+    total_addr_amount = 0
+    token_trend = run.value("smart_money_trend")
+    if token_trend:
+        try:
+            total_addr_amount = int(token_trend.get("total_addr_amount") or 0)
+        except (TypeError, ValueError):
+            total_addr_amount = 0
+        logger.info(f"获取到智能钱数据: {total_addr_amount}名聪明钱")
+
+    return TokenSnapshot(
+        token_address=run.token_address,
+        token_name=token_name,
+        token_symbol=run.value("symbol") or token_name,
+        price=run.value("price"),
+        market_cap=run.value("market_cap"),
+        holders=run.value("holders"),
+        launch_ts=run.value("launch_ts"),
+        top10_holding=run.value("top10_holding"),
+        dev_status=run.value("dev_status"),
+        dev_wallet_balance=run.value("dev_wallet_balance", 0.0),
+        total_addr_amount=total_addr_amount,
+        security=run.value("risk_items", {}),
+        twitter_url=run.value("twitter_url"),
+        website_url=run.value("website_url"),
+    )
+
+
+async def enrich(profile: Profile, token_address: str, inputs: Optional[Dict[str, Any]] = None) -> Optional[TokenSnapshot]:
+    """按 profile 查詢各數據源並解析字段；缺少必需數據或關鍵數據（價格、市值、持幣人數）時返回 None。"""
+    run = EnrichmentRun(profile, token_address, inputs)
+    run.resolve()
+    for phase in profile.phases:
+        sources: List[Source] = [s for s in phase if run.should_fetch(s)]
+        if not sources:
+            continue
+        # 同一階段互不依賴，並行發出且各自有截止時間，任一失敗不影響其餘結果
+        results = await asyncio.gather(*(
+            run_stage(s.name, s.fetch(run), timeout=s.deadline, default=s.default, timings=run.timings)
+            for s in sources
+        ))
+        for source, (data, _) in zip(sources, results):
+            run.data[source.name] = data
+            if run.missing_required(source.name):
+                logger.error(f"必需數據源 {source.name} 無可用數據，跳過增強: profile={profile.name}, token={token_address}")
+                return None
+        run.resolve()
+
+    logger.info(f"代幣信息增強耗時 profile={profile.name} token={token_address}: {format_timings(run.timings)}")
+
+    missing = run.missing(VOLATILE_FIELDS)
+    if missing:
+        logger.info(
+            f"跳過推送：缺少關鍵數據 token={token_address}, price={run.value('price')}, "
+            f"market_cap={run.value('market_cap')}, holders={run.value('holders')}"
+        )
+        return None
+
+    snapshot = build_snapshot(run)
+    if profile.finalize is not None:
+        await profile.finalize(run, snapshot)
+    return snapshot
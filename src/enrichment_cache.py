@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 代幣信息增強結果緩存：進程內 LRU + 可選 Redis 層（多實例共享）
+ENRICH_CACHE_ENABLED = os.getenv("ENRICH_CACHE_ENABLED", "true").lower() == "true"
+ENRICH_CACHE_MAX_ENTRIES = int(os.getenv("ENRICH_CACHE_MAX_ENTRIES", "5000"))
+ENRICH_CACHE_REDIS_ENABLED = os.getenv("ENRICH_CACHE_REDIS_ENABLED", "false").lower() == "true"
+# 名稱/符號/社交/發射時間等視為不變字段；價格/市值/持有人等易變字段只保留數秒
+ENRICH_CACHE_STATIC_TTL = float(os.getenv("ENRICH_CACHE_STATIC_TTL", str(6 * 3600)))
+ENRICH_CACHE_VOLATILE_TTL = float(os.getenv("ENRICH_CACHE_VOLATILE_TTL", "15"))
+ENRICH_CACHE_SMART_MONEY_TTL = float(os.getenv("ENRICH_CACHE_SMART_MONEY_TTL", "30"))
+ENRICH_CACHE_BALANCE_TTL = float(os.getenv("SOL_BALANCE_CACHE_TTL", "30"))
+
+_REDIS_KEY_PREFIX = "enrich"
+
+
+class FieldPolicy:
+    """一類緩存數據的字段新鮮度策略。
+
+    static_fields 在 static_ttl 內有效，其餘字段在 volatile_ttl 內有效；
+    volatile_fields 列出需要定期刷新的字段（上游支持時可只取這些字段，如 ES _source 過濾）。
+    """
+
+    __slots__ = ("static_fields", "volatile_fields", "static_ttl", "volatile_ttl")
+
+    def __init__(
+        self,
+        volatile_ttl: float,
+        static_fields: Sequence[str] = (),
+        static_ttl: float = ENRICH_CACHE_STATIC_TTL,
+        volatile_fields: Sequence[str] = (),
+    ):
+        self.static_fields: FrozenSet[str] = frozenset(static_fields)
+        self.volatile_fields: Tuple[str, ...] = tuple(volatile_fields)
+        self.static_ttl = static_ttl if static_fields else volatile_ttl
+        self.volatile_ttl = volatile_ttl
+
+
+POLICIES: Dict[str, FieldPolicy] = {
+    "es": FieldPolicy(
+        ENRICH_CACHE_VOLATILE_TTL,
+        static_fields=("name", "symbol", "created_at", "social_info", "contract_info", "total_supply"),
+        volatile_fields=("price_usd", "market_cap_usd", "fdv_usd", "holder_info", "security_info"),
+    ),
+    "solscan": FieldPolicy(
+        ENRICH_CACHE_VOLATILE_TTL,
+        static_fields=("name", "symbol", "metadata", "created_time", "creator", "supply", "decimals"),
+        volatile_fields=("price", "market_cap", "holder"),
+    ),
+    "smart_money": FieldPolicy(ENRICH_CACHE_SMART_MONEY_TTL),
+    "balance": FieldPolicy(ENRICH_CACHE_BALANCE_TTL),
+}
+
+
+def _present(value: Any) -> bool:
+    return value not in (None, "", [], {})
+
+
+class _Entry:
+    __slots__ = ("value", "static_at", "volatile_at")
+
+    def __init__(self, value: Any, static_at: float, volatile_at: float):
+        self.value = value
+        self.static_at = static_at
+        self.volatile_at = volatile_at
+
+    def to_json(self) -> str:
+        return json.dumps({"v": self.value, "s": self.static_at, "t": self.volatile_at}, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "_Entry":
+        data = json.loads(raw)
+        return cls(data["v"], float(data["s"]), float(data["t"]))
+
+
+class EnrichmentCache:
+    """按 (類別, 鍵) 緩存上游返回，字段按 FieldPolicy 分別判斷新鮮度。"""
+
+    def __init__(self, max_entries: int = ENRICH_CACHE_MAX_ENTRIES, redis_enabled: bool = ENRICH_CACHE_REDIS_ENABLED):
+        self._max_entries = max(1, int(max_entries))
+        self._redis_enabled = redis_enabled
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._stats = {"fresh_hits": 0, "static_hits": 0, "misses": 0, "redis_hits": 0, "puts": 0, "evicted": 0}
+
+    @staticmethod
+    def _redis_key(component: str, key: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:{component}:{key}"
+
+    def _store_local(self, component: str, key: str, entry: _Entry) -> None:
+        self._entries[(component, key)] = entry
+        self._entries.move_to_end((component, key))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evicted"] += 1
+
+    async def _load(self, component: str, key: str) -> Optional[_Entry]:
+        entry = self._entries.get((component, key))
+        if entry is not None:
+            self._entries.move_to_end((component, key))
+            return entry
+        if not self._redis_enabled:
+            return None
+        raw = await redis_client.get_value(self._redis_key(component, key))
+        if not raw:
+            return None
+        try:
+            entry = _Entry.from_json(raw)
+        except Exception as e:
+            logger.warning(f"增強緩存 Redis 數據無法解析（忽略）: {component}:{key}, err={e}")
+            return None
+        self._stats["redis_hits"] += 1
+        self._store_local(component, key, entry)
+        return entry
+
+    async def _save(self, component: str, key: str, entry: _Entry) -> None:
+        self._stats["puts"] += 1
+        self._store_local(component, key, entry)
+        if self._redis_enabled:
+            await redis_client.set_value(
+                self._redis_key(component, key), entry.to_json(), int(POLICIES[component].static_ttl)
+            )
+
+    async def lookup(self, component: str, key: str) -> Tuple[Optional[Any], List[str]]:
+        """返回 (可用數據, 需重新獲取的字段)。
+
+        - (None, [])：無可用緩存，需完整獲取
+        - (value, [])：全部字段新鮮
+        - (靜態字段子集, 字段列表)：僅不變字段可用，列表為過期的易變字段與緩存中缺失的不變字段
+        """
+        if not ENRICH_CACHE_ENABLED:
+            return None, []
+        policy = POLICIES[component]
+        entry = await self._load(component, key)
+        now = time.time()
+        if entry is None or now - entry.static_at > policy.static_ttl:
+            self._stats["misses"] += 1
+            return None, []
+        if now - entry.volatile_at <= policy.volatile_ttl:
+            self._stats["fresh_hits"] += 1
+            return entry.value, []
+        if not policy.static_fields or not isinstance(entry.value, dict):
+            self._stats["misses"] += 1
+            return None, []
+        static = {f: entry.value[f] for f in policy.static_fields if _present(entry.value.get(f))}
+        if not static:
+            self._stats["misses"] += 1
+            return None, []
+        self._stats["static_hits"] += 1
+        missing_static = sorted(policy.static_fields - static.keys())
+        return static, list(policy.volatile_fields) + missing_static
+
+    @staticmethod
+    def static_complete(component: str, refetch: List[str]) -> bool:
+        """lookup 返回的待取字段是否只有易變字段（即緩存的不變字段齊全）。"""
+        return set(refetch) <= set(POLICIES[component].volatile_fields)
+
+    async def get(self, component: str, key: str) -> Optional[Any]:
+        """僅在全部字段新鮮時返回緩存值。"""
+        value, refetch = await self.lookup(component, key)
+        return value if value is not None and not refetch else None
+
+    async def put(self, component: str, key: str, value: Any) -> None:
+        if not ENRICH_CACHE_ENABLED or value is None:
+            return
+        now = time.time()
+        await self._save(component, key, _Entry(value, now, now))
+
+    async def put_partial(self, component: str, key: str, static: Dict, fresh: Dict) -> Dict:
+        """以緩存中的不變字段合併新取得的字段，返回合併結果。
+
+        新取得的字段覆蓋緩存值；若其中補齊了缺失的不變字段，不變字段的時間戳保持原值。
+        """
+        merged = {**static, **fresh}
+        if not ENRICH_CACHE_ENABLED:
+            return merged
+        entry = self._entries.get((component, key))
+        static_at = entry.static_at if entry is not None else time.time()
+        await self._save(component, key, _Entry(merged, static_at, time.time()))
+        return merged
+
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._entries), "redis_enabled": self._redis_enabled, **self._stats}
+
+
+enrichment_cache = EnrichmentCache()
@@ -1,12 +1,17 @@
 import os
+import json
 import asyncio
 import logging
-from typing import List, Dict, Optional, Any, Set
+from contextlib import aclosing
+from typing import AsyncIterator, List, Dict, Optional, Any, Set, Tuple
 
 import aiohttp
 from dotenv import load_dotenv
-import redis
+import redis_client
+from metrics import record_dedupe
+from singleflight import SingleFlight
 from logging_setup import setup_logging
+from http_client import get_http_session, timeout_for
 import time
 import random
 
@@ -16,27 +21,6 @@ load_dotenv(override=True)
 setup_logging()
 
 logger = logging.getLogger(__name__)
-# Redis 配置（分佈式冪等）
-REDIS_HOST = os.getenv("REDIS_HOST")
-REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
-REDIS_DB = int(os.getenv("REDIS_DB", "0"))
-
-_redis_client: Optional[redis.Redis] = None
-
-def _get_redis() -> Optional[redis.Redis]:
-    global _redis_client
-    if _redis_client is None and REDIS_HOST:
-        _redis_client = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            password=REDIS_PASSWORD,
-            db=REDIS_DB,
-            decode_responses=True,
-            socket_timeout=2,
-        )
-    return _redis_client
-
 # 冪等鍵 TTL（秒）
 IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "3600"))
 
@@ -51,6 +35,18 @@ ES_PASSWORD = os.getenv("ES_PASSWORD", "J4U#dh8Kd1Fz")
 ES_QUERY_SIZE = int(os.getenv("ES_QUERY_SIZE", "500"))
 ES_SORT_FIELD = os.getenv("ES_SORT_FIELD", "heat_score.m5")
 ES_SORT_ORDER = os.getenv("ES_SORT_ORDER", "desc")
+# 熱度查詢直接帶回評估所需欄位（market_info / created_at / 市值相關），大多數代幣無需二次查詢
+ES_RANKING_FULL_SOURCE = os.getenv("ES_RANKING_FULL_SOURCE", "1") == "1"
+# 將分級門檻（近 N 天創建、市值、5 分鐘成交筆數/成交額）下推到 ES 熱度查詢，只返回可能命中的文檔
+ES_TIER_FILTER_PUSHDOWN = os.getenv("ES_TIER_FILTER_PUSHDOWN", "1") == "1"
+# 串流掃描（point-in-time + search_after）：每頁文檔數、每輪最多掃描文檔數、PIT 保活時間
+ES_SCAN_PAGE_SIZE = int(os.getenv("ES_SCAN_PAGE_SIZE", "200"))
+ES_SCAN_MAX_HITS = int(os.getenv("ES_SCAN_MAX_HITS", str(ES_QUERY_SIZE)))
+ES_PIT_KEEP_ALIVE = os.getenv("ES_PIT_KEEP_ALIVE", "1m")
+# 批量詳情查詢（_mget / _msearch）單次請求的文檔數
+ES_DETAIL_BATCH_SIZE = int(os.getenv("ES_DETAIL_BATCH_SIZE", "100"))
+# 並發的詳情查詢中相同地址只查一次
+_detail_flight = SingleFlight("es_detail")
 
 # 定時任務間隔（秒）
 # 若未指定單一定時間隔，將在 [3h,5h] 之間隨機
@@ -111,19 +107,113 @@ def _build_search_url() -> str:
     return f"{ES_BASE_URL.rstrip('/')}/{ES_INDEX}/_search"
 
 
-def _build_payload() -> Dict:
+def _build_mget_url() -> str:
+    return f"{ES_BASE_URL.rstrip('/')}/{ES_INDEX}/_mget"
+
+
+def _build_msearch_url() -> str:
+    return f"{ES_BASE_URL.rstrip('/')}/{ES_INDEX}/_msearch"
+
+
+# 評估與推送所需的欄位（見 evaluate_token_tiers / try_push_token）
+_EVALUATION_SOURCE_FIELDS = [
+    "market_info",
+    "created_at",
+    "fdv_usd",
+    "total_supply",
+]
+
+
+# 5 分鐘成交額可能出現的欄位（依序取第一個存在的）
+_M5_VOLUME_KEYS = [
+    "m5_volume_usd",
+    "m5_total_usd",
+    "m5_usd",
+    "m5_volume",
+    "m5_amount_usd",
+]
+
+# 最低推送市值（與 _tier_from_market_cap 的第 1 級一致）
+_MIN_PUSH_MARKET_CAP_USD = 2_000_000
+
+
+def _range_or_missing(field: str, gte: float) -> Dict[str, Any]:
+    """field >= gte，或欄位不存在（交由客戶端規則判斷）。"""
+    return {
+        "bool": {
+            "should": [
+                {"range": {field: {"gte": gte}}},
+                {"bool": {"must_not": {"exists": {"field": field}}}},
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+
+
+def _build_tier_filter() -> List[Dict[str, Any]]:
+    """分級門檻的 ES filter 子句。
+
+    市值與成交條件取各級門檻的最小值，是客戶端規則的超集：服務端只剔除一定不會命中的文檔，
+    精確的分級判斷仍由 evaluate_token_tiers / try_push_token 完成。
+    欄位缺失的文檔一律放行，由客戶端的後備規則（fdv_usd、price*supply 等）判斷。
+
+    created_at 子句不是超集：try_push_token 本身不檢查創建時間，開啟下推後
+    超過 RECENT_TOKEN_DAYS 的代幣不會進入掃描，最近創建窗口對推送改由服務端強制執行。
+    """
+    min_txns = min(TIER1_TXNS, TIER2_TXNS)
+    min_volume = min(TIER1_VOL_USD, TIER2_VOL_USD)
+    recent_cutoff_ms = int(_now_ts() * 1000) - RECENT_TOKEN_DAYS * 24 * 3600 * 1000
+
+    # 市值：market_cap_usd 達標；或 market_cap_usd 缺失/非正數時由 fdv_usd 或客戶端後備計算決定
+    market_cap_clause = {
+        "bool": {
+            "should": [
+                {"range": {"market_cap_usd": {"gte": _MIN_PUSH_MARKET_CAP_USD}}},
+                {"range": {"fdv_usd": {"gte": _MIN_PUSH_MARKET_CAP_USD}}},
+                {"range": {"market_cap_usd": {"lte": 0}}},
+                {"bool": {"must_not": {"exists": {"field": "market_cap_usd"}}}},
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+    # 成交額：任一候選欄位達標，或所有候選欄位都不存在
+    volume_clause = {
+        "bool": {
+            "should": [
+                *({"range": {f"market_info.{key}": {"gte": min_volume}}} for key in _M5_VOLUME_KEYS),
+                {"bool": {"must_not": [{"exists": {"field": f"market_info.{key}"}} for key in _M5_VOLUME_KEYS]}},
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+    return [
+        {"term": {"network": "SOLANA"}},
+        _range_or_missing("created_at", recent_cutoff_ms),
+        market_cap_clause,
+        _range_or_missing("market_info.m5_total_txns", min_txns),
+        volume_clause,
+    ]
+
+
+def _build_payload(pushdown: bool = ES_TIER_FILTER_PUSHDOWN) -> Dict:
+    source_fields = [
+        "symbol",
+        "name",
+        "address",
+        "heat_score",
+        "price_usd",
+        "market_cap_usd",
+    ]
+    if ES_RANKING_FULL_SOURCE:
+        source_fields += _EVALUATION_SOURCE_FIELDS
+    query: Dict[str, Any] = {"match_all": {}}
+    if pushdown:
+        query = {"bool": {"filter": _build_tier_filter()}}
     return {
-        "query": {"match_all": {}},
+        "query": query,
         "sort": [{ES_SORT_FIELD: {"order": ES_SORT_ORDER}}],
         "size": ES_QUERY_SIZE,
-        "_source": [
-            "symbol",
-            "name",
-            "address",
-            "heat_score",
-            "price_usd",
-            "market_cap_usd",
-        ],
+        "_source": source_fields,
     }
 
 
@@ -132,18 +222,122 @@ async def fetch_hot_tokens(session: aiohttp.ClientSession) -> List[Dict]:
     url = _build_search_url()
     payload = _build_payload()
     try:
-        async with session.post(url, json=payload, auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD), timeout=aiohttp.ClientTimeout(total=20)) as resp:
-            if resp.status != 200:
+        while True:
+            async with session.post(url, json=payload, auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD), timeout=timeout_for("es_scan")) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    return data.get("hits", {}).get("hits", [])
                 text = await resp.text()
-                logger.error(f"查詢熱度表失敗: HTTP {resp.status}, body={text[:500]}")
-                return []
-            data = await resp.json()
-            return data.get("hits", {}).get("hits", [])
+            if resp.status == 400 and "bool" in payload["query"]:
+                # 下推的 filter 與索引 mapping 不兼容時，退回不過濾的查詢，完全由客戶端規則判斷
+                logger.warning(f"熱度表過濾查詢被拒絕，退回全量查詢: body={text[:300]}")
+                payload = _build_payload(pushdown=False)
+                continue
+            logger.error(f"查詢熱度表失敗: HTTP {resp.status}, body={text[:500]}")
+            return []
     except Exception as e:
         logger.error(f"請求熱度表發生異常: {e}")
         return []
 
 
+async def _open_pit(session: aiohttp.ClientSession) -> Optional[str]:
+    url = f"{ES_BASE_URL.rstrip('/')}/{ES_INDEX}/_pit?keep_alive={ES_PIT_KEEP_ALIVE}"
+    try:
+        async with session.post(url, auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD), timeout=timeout_for("es")) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                logger.warning(f"建立 ES point-in-time 失敗: HTTP {resp.status}, body={text[:300]}")
+                return None
+            data = await resp.json()
+            return data.get("id")
+    except Exception as e:
+        logger.warning(f"建立 ES point-in-time 發生異常: {e}")
+        return None
+
+
+async def _close_pit(session: aiohttp.ClientSession, pit_id: str) -> None:
+    url = f"{ES_BASE_URL.rstrip('/')}/_pit"
+    try:
+        async with session.delete(url, json={"id": pit_id}, auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD), timeout=timeout_for("es")) as resp:
+            if resp.status not in (200, 404):
+                logger.warning(f"關閉 ES point-in-time 失敗: HTTP {resp.status}")
+    except Exception as e:
+        logger.warning(f"關閉 ES point-in-time 發生異常: {e}")
+
+
+async def scan_hot_tokens(session: aiohttp.ClientSession, max_hits: Optional[int] = None) -> AsyncIterator[Dict]:
+    """按熱度排序串流返回 hits（point-in-time + search_after，每次只持有一頁）。
+
+    調用方可隨時停止迭代；請以 contextlib.aclosing 包裹，確保 PIT 及時釋放。
+    集群不支持 PIT，或 PIT 首頁查詢（如不支持 _shard_doc 次級排序的 ES 7.10/7.11）失敗時，
+    退回單頁查詢（fetch_hot_tokens）。
+    """
+    limit = ES_SCAN_MAX_HITS if max_hits is None else max_hits
+    pit_id = await _open_pit(session)
+    if not pit_id:
+        for hit in (await fetch_hot_tokens(session))[:limit]:
+            yield hit
+        return
+
+    url = f"{ES_BASE_URL.rstrip('/')}/_search"
+    payload = _build_payload()
+    search_after: Optional[List[Any]] = None
+    yielded = 0
+    first_page_failed = False
+    try:
+        while yielded < limit:
+            page_size = min(max(1, ES_SCAN_PAGE_SIZE), limit - yielded)
+            body: Dict[str, Any] = {
+                "query": payload["query"],
+                "_source": payload["_source"],
+                # _shard_doc 作為 PIT 內的穩定次級排序，保證翻頁不重不漏
+                "sort": payload["sort"] + [{"_shard_doc": "asc"}],
+                "size": page_size,
+                "pit": {"id": pit_id, "keep_alive": ES_PIT_KEEP_ALIVE},
+                "track_total_hits": False,
+            }
+            if search_after is not None:
+                body["search_after"] = search_after
+            async with session.post(url, json=body, auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD), timeout=timeout_for("es_scan")) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    text = ""
+                else:
+                    data = None
+                    text = await resp.text()
+            if data is None:
+                if resp.status == 400 and search_after is None and "bool" in payload["query"]:
+                    # 下推的 filter 與索引 mapping 不兼容時，退回不過濾的查詢
+                    logger.warning(f"熱度表過濾查詢被拒絕，退回全量查詢: body={text[:300]}")
+                    payload = _build_payload(pushdown=False)
+                    continue
+                if search_after is None:
+                    logger.warning(f"PIT 串流首頁查詢失敗，退回單頁查詢: HTTP {resp.status}, body={text[:300]}")
+                    first_page_failed = True
+                    break
+                logger.error(f"串流掃描熱度表失敗: HTTP {resp.status}, body={text[:500]}")
+                return
+
+            pit_id = data.get("pit_id") or pit_id
+            hits = data.get("hits", {}).get("hits", [])
+            if not hits:
+                return
+            for hit in hits:
+                yield hit
+            yielded += len(hits)
+            if len(hits) < page_size:
+                return
+            search_after = hits[-1].get("sort")
+            if not search_after:
+                return
+    finally:
+        await _close_pit(session, pit_id)
+
+    if first_page_failed:
+        for hit in (await fetch_hot_tokens(session))[:limit]:
+            yield hit
+
+
 def _is_bsc_doc(doc_id: str) -> bool:
     return isinstance(doc_id, str) and doc_id.startswith("BSC_")
 
@@ -176,13 +370,45 @@ def extract_solana_addresses(hits: List[Dict]) -> List[str]:
 
 async def get_top_solana_addresses(limit: Optional[int] = None) -> List[str]:
     """對外函數：取得按熱度排序的 SOLANA address 清單。"""
-    timeout = aiohttp.ClientTimeout(total=30)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        hits = await fetch_hot_tokens(session)
-        addresses = extract_solana_addresses(hits)
-        if limit is not None and limit > 0:
-            return addresses[:limit]
-        return addresses
+    session = get_http_session()
+    hits = await fetch_hot_tokens(session)
+    addresses = extract_solana_addresses(hits)
+    if limit is not None and limit > 0:
+        return addresses[:limit]
+    return addresses
+
+
+def extract_solana_sources(hits: List[Dict]) -> Dict[str, Dict[str, Any]]:
+    """由熱度表 hits 取出 SOLANA address -> _source（保留第一次出現的文檔）。"""
+    sources: Dict[str, Dict[str, Any]] = {}
+    for item in hits:
+        if not _is_solana_doc(item.get("_id", "")):
+            continue
+        src = item.get("_source", {}) or {}
+        address = src.get("address")
+        if address and str(address) not in sources:
+            sources[str(address)] = src
+    return sources
+
+
+async def iter_solana_sources(hits: AsyncIterator[Dict]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """extract_solana_addresses 的串流版本：依序產出 (address, _source)，跳過非 SOLANA 並去重。"""
+    seen: Set[str] = set()
+    # 提前停止時一併關閉上游生成器（釋放 PIT）
+    async with aclosing(hits):
+        async for item in hits:
+            if not _is_solana_doc(item.get("_id", "")):
+                continue
+            src = item.get("_source", {}) or {}
+            address = src.get("address")
+            if address and str(address) not in seen:
+                seen.add(str(address))
+                yield str(address), src
+
+
+def _has_evaluation_fields(src: Optional[Dict[str, Any]]) -> bool:
+    """熱度查詢返回的 _source 是否已足夠直接評估（否則需查詢詳情）。"""
+    return bool(src) and src.get("market_info") is not None and src.get("created_at") is not None
 
 
 def _build_detail_payload(address: str) -> Dict[str, Any]:
@@ -202,30 +428,107 @@ def _build_detail_payload(address: str) -> Dict[str, Any]:
 
 async def fetch_token_detail(session: aiohttp.ClientSession, address: str) -> Optional[Dict[str, Any]]:
     """查詢單一 SOLANA token 詳細資料，返回 _source。失敗返回 None。"""
-    url = _build_search_url()
-    payload = _build_detail_payload(address)
+    details = await fetch_token_details(session, [address])
+    return details.get(address)
+
+
+async def _mget_token_details(session: aiohttp.ClientSession, addresses: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """以文檔 id（SOLANA_<address>）一次 _mget 多個 token；請求失敗返回 None。"""
+    payload = {"ids": [f"SOLANA_{addr}" for addr in addresses]}
     try:
         async with session.post(
-            url,
+            _build_mget_url(),
             json=payload,
             auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD),
-            timeout=aiohttp.ClientTimeout(total=20),
+            timeout=timeout_for("es_scan"),
         ) as resp:
             if resp.status != 200:
                 text = await resp.text()
-                logger.error(
-                    f"查詢 token 詳情失敗: address={address}, HTTP {resp.status}, body={text[:300]}"
-                )
+                logger.warning(f"批量查詢 token 詳情(_mget)失敗: HTTP {resp.status}, body={text[:300]}")
                 return None
             data = await resp.json()
-            hits = data.get("hits", {}).get("hits", [])
-            if not hits:
-                return None
-            return hits[0].get("_source") or None
     except Exception as e:
-        logger.error(f"請求 token 詳情發生異常: address={address}, err={e}")
+        logger.warning(f"批量查詢 token 詳情(_mget)發生異常: {e}")
         return None
 
+    details: Dict[str, Dict[str, Any]] = {}
+    for doc in data.get("docs", []):
+        if not doc.get("found"):
+            continue
+        src = doc.get("_source") or {}
+        doc_id = doc.get("_id", "")
+        address = src.get("address") or (doc_id[len("SOLANA_"):] if _is_solana_doc(doc_id) else None)
+        if address and src:
+            details[str(address)] = src
+    return details
+
+
+async def _msearch_token_details(session: aiohttp.ClientSession, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+    """以 _msearch 一次請求執行多個 address + network 查詢（_mget 未命中時的後備）。"""
+    lines: List[str] = []
+    for addr in addresses:
+        lines.append("{}")
+        lines.append(json.dumps(_build_detail_payload(addr)))
+    body = "\n".join(lines) + "\n"
+    try:
+        async with session.post(
+            _build_msearch_url(),
+            data=body,
+            headers={"Content-Type": "application/x-ndjson"},
+            auth=aiohttp.BasicAuth(ES_USERNAME, ES_PASSWORD),
+            timeout=timeout_for("es_scan"),
+        ) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                logger.error(f"批量查詢 token 詳情(_msearch)失敗: HTTP {resp.status}, body={text[:300]}")
+                return {}
+            data = await resp.json()
+    except Exception as e:
+        logger.error(f"批量查詢 token 詳情(_msearch)發生異常: {e}")
+        return {}
+
+    details: Dict[str, Dict[str, Any]] = {}
+    for addr, item in zip(addresses, data.get("responses", [])):
+        if item.get("error"):
+            logger.warning(f"查詢 token 詳情失敗: address={addr}, err={str(item.get('error'))[:200]}")
+            continue
+        hits = item.get("hits", {}).get("hits", [])
+        if hits and hits[0].get("_source"):
+            details[addr] = hits[0]["_source"]
+    return details
+
+
+async def fetch_token_details(session: aiohttp.ClientSession, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+    """批量查詢 SOLANA token 詳細資料，返回 address -> _source（查不到的地址不在結果中）。
+
+    其他調用方正在查詢的地址直接等待其結果，只對其餘地址發出請求。
+    """
+    keys = [a for a in addresses if a]
+    return await _detail_flight.do_batch(keys, lambda missing: _fetch_token_details(session, missing))
+
+
+async def _fetch_token_details(session: aiohttp.ClientSession, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+    """優先以文檔 id 走 _mget；_mget 失敗或未命中的地址再以 _msearch 按 address + network 查詢。
+    每 ES_DETAIL_BATCH_SIZE 個地址一次請求，最多 DETAIL_CONCURRENCY 個請求並發。
+    """
+    unique = list(dict.fromkeys(a for a in addresses if a))
+    batch_size = max(1, ES_DETAIL_BATCH_SIZE)
+    sem = asyncio.Semaphore(max(1, DETAIL_CONCURRENCY))
+
+    async def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        async with sem:
+            found = await _mget_token_details(session, chunk) or {}
+            missing = [a for a in chunk if a not in found]
+            if missing:
+                found.update(await _msearch_token_details(session, missing))
+            return found
+
+    details: Dict[str, Dict[str, Any]] = {}
+    chunks = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+    for found in await asyncio.gather(*(fetch_chunk(c) for c in chunks)):
+        details.update(found)
+    return details
+
 
 def _compute_market_cap_usd(src: Dict[str, Any]) -> float:
     market_cap = src.get("market_cap_usd")
@@ -271,14 +574,7 @@ def _get_m5_total_txns(src: Dict[str, Any]) -> int:
 def _get_m5_volume_usd(src: Dict[str, Any]) -> float:
     """嘗試從多個可能欄位讀取 5 分鐘成交額（美元）"""
     market_info = src.get("market_info") or {}
-    candidate_keys = [
-        "m5_volume_usd",
-        "m5_total_usd",
-        "m5_usd",
-        "m5_volume",
-        "m5_amount_usd",
-    ]
-    for key in candidate_keys:
+    for key in _M5_VOLUME_KEYS:
         if key in market_info and market_info.get(key) is not None:
             try:
                 return float(market_info.get(key) or 0)
@@ -328,6 +624,15 @@ def _now_ts() -> float:
     return time.time()
 
 
+def _recently_pushed_addresses() -> List[str]:
+    return [a for a, ts in _address_to_first_push_ts.items() if _within_last_hour(ts)]
+
+
+def _push_budget_exhausted() -> bool:
+    """一小時內的唯一代幣推送額度是否已用完（已推送代幣仍可升級）。"""
+    return len(set(_recently_pushed_addresses())) >= _UNIQUE_TOKENS_PER_HOUR_LIMIT
+
+
 def _within_last_hour(ts: float) -> bool:
     return (_now_ts() - ts) < 3600
 
@@ -354,7 +659,7 @@ async def _await_push_slot() -> None:
 async def _post_premium_push(session: aiohttp.ClientSession, payload: Dict[str, Any]) -> bool:
     url = f"{API_SCHEME}://{API_HOST}:{API_PORT}{API_PUSH_PATH}"
     try:
-        async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+        async with session.post(url, json=payload, timeout=timeout_for("internal")) as resp:
             if resp.status == 200:
                 return True
             text = await resp.text()
@@ -365,15 +670,28 @@ async def _post_premium_push(session: aiohttp.ClientSession, payload: Dict[str,
         return False
 
 
-async def try_push_token(session: aiohttp.ClientSession, src: Dict[str, Any]) -> bool:
+def _passes_push_thresholds(src: Dict[str, Any]) -> bool:
+    """市值等級與 5 分鐘成交條件的預篩（與 try_push_token 的判斷一致，不含冪等/限速）。"""
+    target_level = _tier_from_market_cap(_compute_market_cap_usd(src))
+    if target_level <= 0:
+        return False
+    req_txns, req_vol = {
+        1: (TIER1_TXNS, TIER1_VOL_USD),
+        2: (TIER2_TXNS, TIER2_VOL_USD),
+        3: (TIER3_TXNS, TIER3_VOL_USD),
+    }.get(target_level, (0, 0.0))
+    return _get_m5_total_txns(src) >= req_txns and _get_m5_volume_usd(src) >= req_vol
+
+
+async def try_push_token(session: aiohttp.ClientSession, src: Dict[str, Any], refreshed: bool = False) -> bool:
     address: str = src.get("address") or ""
     if not address or address in EXCLUDED_ADDRESSES:
         if address in EXCLUDED_ADDRESSES:
             logger.debug(f"推送跳過: address 在排除清單")
         return False
 
-    # 可選：推送前刷新一次詳情，確保價格/市值使用最新數據
-    if REFRESH_BEFORE_PUSH:
+    # 可選：推送前刷新一次詳情，確保價格/市值使用最新數據（調用方已批量刷新時跳過）
+    if REFRESH_BEFORE_PUSH and not refreshed:
         try:
             latest = await fetch_token_detail(session, address)
             if latest:
@@ -405,15 +723,13 @@ async def try_push_token(session: aiohttp.ClientSession, src: Dict[str, Any]) ->
         return False
 
     # 分佈式冪等鍵（跨進程）：確保相同地址與等級在 TTL 內只推一次
-    try:
-        r = _get_redis()
-        if r is not None:
-            idem_key = f"premium:idemp:SOL:{address}:{target_level}"
-            if not r.set(name=idem_key, value="1", nx=True, ex=IDEMPOTENCY_TTL_SECONDS):
-                logger.info(f"推送跳過: 冪等鍵命中 address={address}, level={target_level}")
-                return False
-    except Exception as e:
-        logger.warning(f"Redis 冪等檢查失敗（略過使用本地策略）: {e}")
+    # Redis 不可用或熔斷時 set_nx 返回 None，退回本地策略
+    idem_key = f"premium:idemp:SOL:{address}:{target_level}"
+    claimed = await redis_client.set_nx(idem_key, IDEMPOTENCY_TTL_SECONDS)
+    record_dedupe("premium:idemp", claimed)
+    if claimed is False:
+        logger.info(f"推送跳過: 冪等鍵命中 address={address}, level={target_level}")
+        return False
 
     # 速率限制：1小時內最多推送2個不同代幣
     async with _push_lock:
@@ -492,61 +808,92 @@ async def _scheduler_loop() -> None:
     logger.info(
         f"啟動熱度表定時任務：間隔隨機 {FETCH_MIN_SECONDS}~{FETCH_MAX_SECONDS}s，索引 {ES_INDEX}，排序 {ES_SORT_FIELD} {ES_SORT_ORDER}"
     )
-    timeout = aiohttp.ClientTimeout(total=30)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        while True:
-            try:
-                hits = await fetch_hot_tokens(session)
-                addresses = extract_solana_addresses(hits)
+    while True:
+        try:
+            session = get_http_session()
+            ranking_sources: Dict[str, Dict[str, Any]] = {}
+
+            async def load_batch(batch: List[str]) -> Dict[str, Dict[str, Any]]:
+                """熱度查詢已帶回完整欄位的直接使用，其餘一次批量查詢詳情。"""
+                sources = {a: ranking_sources[a] for a in batch if _has_evaluation_fields(ranking_sources.get(a))}
+                missing = [a for a in batch if a not in sources]
+                if missing:
+                    sources.update(await fetch_token_details(session, missing))
+                # 推送前刷新：只對通過預篩的候選批量刷新一次，取代逐個查詢；剛補查的詳情已是最新，不再重複查詢
+                if REFRESH_BEFORE_PUSH:
+                    fetched = set(missing)
+                    candidates = [
+                        a for a, src in sources.items() if a not in fetched and _passes_push_thresholds(src)
+                    ]
+                    if candidates:
+                        sources.update(await fetch_token_details(session, candidates))
                 logger.info(
-                    f"本次獲取 SOLANA tokens: {len(addresses)}，樣例: {addresses[:5]}"
+                    f"批次詳情: 共 {len(batch)}，熱度查詢直接評估 {len(batch) - len(missing)}，批量補查 {len(missing)}"
                 )
-
-                # 批次並發處理：若前一批沒有任何成功推送，繼續往下掃描
-                sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
-
-                async def process_address(addr: str) -> bool:
-                    async with sem:
-                        src = await fetch_token_detail(session, addr)
-                    if not src:
-                        return False
-                    matched = evaluate_token_tiers(src)
-                    if matched:
-                        symbol = src.get("symbol") or ""
-                        name = src.get("name") or ""
-                        market_cap = _compute_market_cap_usd(src)
-                        m5_txns = _get_m5_total_txns(src)
-                        m5_volume = _get_m5_volume_usd(src)
-                        logger.info(
-                            f"命中條件: address={addr}, symbol={symbol}, name={name}, tiers={matched}, market_cap_usd={market_cap:.2f}, m5_total_txns={m5_txns}, m5_volume_usd={m5_volume:.0f}"
-                        )
-                    # 無論 evaluate 是否命中，最終以 try_push_token 的條件為準
-                    pushed = await try_push_token(session, src)
-                    return pushed
-
-                # 逐批處理整個清單，直到本輪至少推送一個或全部掃完
-                pushed_this_round = 0
-                start_index = 0
-                total = len(addresses)
-                while start_index < total and pushed_this_round == 0:
-                    batch = addresses[start_index:start_index + DETAIL_MAX_TOKENS_PER_CYCLE]
-                    if not batch:
-                        break
-                    # 打亂處理順序，讓命中/推送時間更加隨機
-                    random.shuffle(batch)
-                    results = await asyncio.gather(*(process_address(a) for a in batch))
-                    pushed_in_batch = sum(1 for r in results if r)
-                    pushed_this_round += pushed_in_batch
-                    start_index += DETAIL_MAX_TOKENS_PER_CYCLE
-
-                if pushed_this_round == 0:
-                    logger.info("本輪未找到符合推送條件的代幣，已掃描完整清單或達到批次上限")
-            except Exception as e:
-                logger.error(f"定時任務執行錯誤: {e}")
-            # 每輪結束後在 3~5 小時（可用環境變數覆蓋）之間隨機等待
-            next_sleep = random.randint(min(FETCH_MIN_SECONDS, FETCH_MAX_SECONDS), max(FETCH_MIN_SECONDS, FETCH_MAX_SECONDS))
-            logger.info(f"下一輪抓取將在 {next_sleep} 秒後進行")
-            await asyncio.sleep(next_sleep)
+                return sources
+
+            async def process_address(addr: str, src: Optional[Dict[str, Any]]) -> bool:
+                if not src:
+                    return False
+                matched = evaluate_token_tiers(src)
+                if matched:
+                    symbol = src.get("symbol") or ""
+                    name = src.get("name") or ""
+                    market_cap = _compute_market_cap_usd(src)
+                    m5_txns = _get_m5_total_txns(src)
+                    m5_volume = _get_m5_volume_usd(src)
+                    logger.info(
+                        f"命中條件: address={addr}, symbol={symbol}, name={name}, tiers={matched}, market_cap_usd={market_cap:.2f}, m5_total_txns={m5_txns}, m5_volume_usd={m5_volume:.0f}"
+                    )
+                # 無論 evaluate 是否命中，最終以 try_push_token 的條件為準
+                pushed = await try_push_token(session, src, refreshed=True)
+                return pushed
+
+            async def process_batch(batch: List[str]) -> int:
+                # 打亂處理順序，讓命中/推送時間更加隨機
+                random.shuffle(batch)
+                sources = await load_batch(batch)
+                results = await asyncio.gather(*(process_address(a, sources.get(a)) for a in batch))
+                return sum(1 for r in results if r)
+
+            # 串流掃描熱度表，逐批處理，直到本輪至少推送一個、推送額度用完或全部掃完
+            pushed_this_round = 0
+            scanned = 0
+            budget_exhausted = _push_budget_exhausted()
+            if not budget_exhausted:
+                batch: List[str] = []
+                async with aclosing(iter_solana_sources(scan_hot_tokens(session))) as stream:
+                    async for address, src in stream:
+                        scanned += 1
+                        ranking_sources[address] = src
+                        batch.append(address)
+                        if len(batch) < DETAIL_MAX_TOKENS_PER_CYCLE:
+                            continue
+                        pushed_this_round += await process_batch(batch)
+                        batch, ranking_sources = [], {}
+                        budget_exhausted = _push_budget_exhausted()
+                        if pushed_this_round > 0 or budget_exhausted:
+                            break
+                if batch and pushed_this_round == 0 and not budget_exhausted:
+                    pushed_this_round += await process_batch(batch)
+                    budget_exhausted = _push_budget_exhausted()
+            logger.info(f"本輪串流掃描 SOLANA tokens: {scanned}，推送 {pushed_this_round}")
+
+            if budget_exhausted:
+                # 額度已用完：不再掃描新代幣，只檢查已推送代幣能否升級（不限一小時內，已推送代幣不受額度限制）
+                upgradable = [a for a in _address_to_first_push_ts if _address_to_max_tier.get(a, 0) < 2]
+                ranking_sources = {}
+                for i in range(0, len(upgradable), DETAIL_MAX_TOKENS_PER_CYCLE):
+                    pushed_this_round += await process_batch(upgradable[i:i + DETAIL_MAX_TOKENS_PER_CYCLE])
+                logger.info(f"一小時推送額度已用完（{_UNIQUE_TOKENS_PER_HOUR_LIMIT}），停止掃描")
+            elif pushed_this_round == 0:
+                logger.info("本輪未找到符合推送條件的代幣，已掃描完整清單或達到批次上限")
+        except Exception as e:
+            logger.error(f"定時任務執行錯誤: {e}")
+        # 每輪結束後在 3~5 小時（可用環境變數覆蓋）之間隨機等待
+        next_sleep = random.randint(min(FETCH_MIN_SECONDS, FETCH_MAX_SECONDS), max(FETCH_MIN_SECONDS, FETCH_MAX_SECONDS))
+        logger.info(f"下一輪抓取將在 {next_sleep} 秒後進行")
+        await asyncio.sleep(next_sleep)
 
 
 async def start_scheduler() -> None:
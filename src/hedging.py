@@ -0,0 +1,188 @@
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 對沖請求：主請求超過其近期 p95 仍未返回時，向備援（或同一上游）再發一次，取先成功者
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+# 延遲樣本數與觸發計算所需的最少樣本；樣本不足時使用默認延遲
+HEDGE_LATENCY_SAMPLES = int(os.getenv("HEDGE_LATENCY_SAMPLES", "200"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_DEFAULT_DELAY_MS = float(os.getenv("HEDGE_DEFAULT_DELAY_MS", "1000"))
+HEDGE_MIN_DELAY_MS = float(os.getenv("HEDGE_MIN_DELAY_MS", "50"))
+HEDGE_MAX_DELAY_MS = float(os.getenv("HEDGE_MAX_DELAY_MS", "2500"))
+# 預算：每個請求累積 ratio 個令牌，對沖消耗 1 個（即額外負載最多約 ratio），burst 為令牌上限
+HEDGE_BUDGET_RATIO = float(os.getenv("HEDGE_BUDGET_RATIO", "0.1"))
+HEDGE_BUDGET_BURST = float(os.getenv("HEDGE_BUDGET_BURST", "10"))
+
+_hedge_events_total = registry.counter(
+    "hedged_requests_total",
+    "對沖請求事件（fired=已對沖，primary_won/hedge_won=勝出方，budget_denied=預算不足未對沖，failover=主請求失敗後切換）",
+    ["upstream", "event"],
+)
+_hedge_delay_gauge = registry.gauge("hedge_delay_seconds", "當前對沖觸發延遲（主請求近期分位數）", ["upstream"])
+
+_hedgers: Dict[str, "Hedger"] = {}
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    # 被放棄的請求也取走其異常，避免 "exception was never retrieved" 警告
+    if not task.cancelled():
+        task.exception()
+
+
+class HedgeBudget:
+    """令牌桶：限制對沖請求佔主請求的比例，避免上游變慢時負載翻倍。"""
+
+    __slots__ = ("_ratio", "_burst", "_tokens")
+
+    def __init__(self, ratio: float = HEDGE_BUDGET_RATIO, burst: float = HEDGE_BUDGET_BURST):
+        self._ratio = max(0.0, ratio)
+        self._burst = max(1.0, burst)
+        self._tokens = self._burst
+
+    def deposit(self) -> None:
+        self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class Hedger:
+    """單個上游的對沖器：維護主請求延遲分位數與對沖預算。"""
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float = HEDGE_PERCENTILE,
+        min_delay_ms: float = HEDGE_MIN_DELAY_MS,
+        max_delay_ms: float = HEDGE_MAX_DELAY_MS,
+        default_delay_ms: float = HEDGE_DEFAULT_DELAY_MS,
+        budget: Optional[HedgeBudget] = None,
+    ):
+        self.name = name
+        self._percentile = percentile
+        self._min_delay = min_delay_ms / 1000.0
+        self._max_delay = max_delay_ms / 1000.0
+        self._default_delay = default_delay_ms / 1000.0
+        self._samples: Deque[float] = deque(maxlen=max(1, HEDGE_LATENCY_SAMPLES))
+        self._delay: Optional[float] = None
+        self._since_recompute = 0
+        self._budget = budget or HedgeBudget()
+        self._stats = {"requests": 0, "fired": 0, "primary_won": 0, "hedge_won": 0, "budget_denied": 0, "failover": 0, "failed": 0}
+        _hedgers[name] = self
+
+    def _record_latency(self, elapsed: float) -> None:
+        self._samples.append(elapsed)
+        self._since_recompute += 1
+        # 每 10 個樣本重算一次分位數，避免每個請求都排序
+        if self._since_recompute >= 10:
+            self._since_recompute = 0
+            self._delay = None
+
+    def hedge_delay(self) -> float:
+        if len(self._samples) < HEDGE_MIN_SAMPLES:
+            return self._default_delay
+        if self._delay is None:
+            ordered = sorted(self._samples)
+            idx = min(len(ordered) - 1, int(self._percentile / 100.0 * (len(ordered) - 1)))
+            self._delay = min(self._max_delay, max(self._min_delay, ordered[idx]))
+            _hedge_delay_gauge.set(self._delay, upstream=self.name)
+        return self._delay
+
+    def _event(self, event: str) -> None:
+        self._stats[event] += 1
+        _hedge_events_total.inc(upstream=self.name, event=event)
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        backup: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """執行主請求；超過對沖延遲仍未返回且預算允許時發出對沖請求，返回先成功者的結果。
+
+        backup 為獨立備援（如備用 RPC）時，主請求提前失敗會立即切換到備援（不消耗預算）；
+        未提供 backup 時對沖同一上游，主請求失敗直接拋出，由調用方的重試邏輯處理。
+        兩者都失敗時拋出最後一個異常。
+        """
+        self._stats["requests"] += 1
+        self._budget.deposit()
+        hedge = backup or primary
+        start = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        primary_task.add_done_callback(_consume_result)
+        hedge_task: Optional[asyncio.Future] = None
+        try:
+            delay = self.hedge_delay() if HEDGE_ENABLED else None
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if primary_task in done:
+                if primary_task.exception() is None:
+                    self._record_latency(time.monotonic() - start)
+                    return primary_task.result()
+                if backup is None:
+                    self._stats["failed"] += 1
+                    raise primary_task.exception()
+                self._event("failover")
+                hedge_task = asyncio.ensure_future(hedge())
+                hedge_task.add_done_callback(_consume_result)
+                return await hedge_task
+
+            if not self._budget.try_spend():
+                self._event("budget_denied")
+                result = await primary_task
+                self._record_latency(time.monotonic() - start)
+                return result
+
+            self._event("fired")
+            hedge_task = asyncio.ensure_future(hedge())
+            hedge_task.add_done_callback(_consume_result)
+            pending = {primary_task, hedge_task}
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 同時完成時優先採用主請求
+                for task in sorted(done, key=lambda t: t is not primary_task):
+                    error = task.exception()
+                    if error is not None:
+                        last_error = error
+                        continue
+                    if task is primary_task:
+                        self._record_latency(time.monotonic() - start)
+                        self._event("primary_won")
+                    else:
+                        self._event("hedge_won")
+                    return task.result()
+            self._stats["failed"] += 1
+            raise last_error
+        finally:
+            for task in (primary_task, hedge_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "delay_ms": round(self.hedge_delay() * 1000, 1),
+            "samples": len(self._samples),
+            "budget_tokens": round(self._budget.tokens, 2),
+        }
+
+
+def hedging_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
@@ -1,13 +1,19 @@
 import os
 import json
+import time
 import asyncio
 import logging
-from typing import Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import aiohttp
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, TopicPartition
+from aiokafka.abc import ConsumerRebalanceListener
 from dotenv import load_dotenv
 from logging_setup import setup_logging
+from http_client import get_http_session, timeout_for
+from metrics import registry, RateMeter, start_metrics_server, stop_metrics_server
+from tracing import new_trace_id
 
 
 load_dotenv(override=True)
@@ -28,6 +34,23 @@ KAFKA_AUTO_OFFSET_RESET = os.getenv("KAFKA_AUTO_OFFSET_RESET", "latest")
 
 # 需要關注的事件 type
 TARGET_EVENT_TYPE = "com.zeroex.web3.core.event.data.PoolMigrateEvent"
+# 原始負載中不含該字串的消息一定不是目標事件，可跳過 JSON 解析
+_TARGET_EVENT_TYPE_BYTES = TARGET_EVENT_TYPE.encode("utf-8")
+
+# 批量消費：每次 getmany 最多拉取的消息數與等待時間；單批內最多並發派發數
+KAFKA_MAX_RECORDS = int(os.getenv("KAFKA_MAX_RECORDS", "500"))
+KAFKA_POLL_TIMEOUT_MS = int(os.getenv("KAFKA_POLL_TIMEOUT_MS", "1000"))
+KAFKA_DISPATCH_CONCURRENCY = int(os.getenv("KAFKA_DISPATCH_CONCURRENCY", "20"))
+# 手動提交 offset：每個分區最多允許的未確認消息數，超過則暫停拉取該分區
+KAFKA_MAX_INFLIGHT_PER_PARTITION = int(os.getenv("KAFKA_MAX_INFLIGHT_PER_PARTITION", "1000"))
+# 派發失敗（API 不可用 / 隊列已滿）的重試退避（秒）
+KAFKA_DISPATCH_RETRY_BASE_SECONDS = float(os.getenv("KAFKA_DISPATCH_RETRY_BASE_SECONDS", "1"))
+KAFKA_DISPATCH_RETRY_MAX_SECONDS = float(os.getenv("KAFKA_DISPATCH_RETRY_MAX_SECONDS", "30"))
+# 1 = 在 API 進程內消費並直接入隊（不經 HTTP）；main.py 進程此時不再啟動消費
+HIGH_FREQ_CONSUMER_IN_PROCESS = os.getenv("HIGH_FREQ_CONSUMER_IN_PROCESS", "0") == "1"
+
+# 消費指標服務端口（/metrics），0 表示不啟動
+KAFKA_METRICS_PORT = int(os.getenv("KAFKA_METRICS_PORT", "9108"))
 
 # API 配置（複用本地 API 的端口）
 API_SCHEME = os.getenv("API_SCHEME", "http")
@@ -36,20 +59,343 @@ API_PORT = int(os.getenv("API_PORT", "5011"))
 
 
 _consumer_task: Optional[asyncio.Task] = None
+_metrics_runner = None
+
+# 派發函數：(token_address, network, event_ts 毫秒, trace_id) -> 是否已被接收（True 才會提交 offset）；
+# 默認經 HTTP 提交到 /api/tg_push
+Dispatcher = Callable[[str, str, Optional[int], Optional[str]], Awaitable[bool]]
+
+# 消費指標
+_messages_total = registry.counter("kafka_consumer_messages_total", "Kafka 消息數", ["topic"])
+_target_events_total = registry.counter("kafka_consumer_target_events_total", "PoolMigrateEvent 消息數", ["topic"])
+_decode_errors_total = registry.counter("kafka_consumer_decode_errors_total", "無法解析的消息數", ["topic"])
+_batch_deduped_total = registry.counter("kafka_consumer_deduped_total", "批內/進行中合併的重複事件數")
+_dispatch_total = registry.counter("kafka_consumer_dispatch_total", "事件派發次數", ["result"])
+_lag_gauge = registry.gauge("kafka_consumer_lag", "分區積壓（高水位 - 已提交 offset）", ["topic", "partition"])
+_inflight_gauge = registry.gauge("kafka_consumer_inflight", "分區未確認消息數", ["topic", "partition"])
+_messages_rate_gauge = registry.gauge("kafka_consumer_messages_per_second", "最近窗口內每秒消息數")
+_decode_errors_rate_gauge = registry.gauge("kafka_consumer_decode_errors_per_second", "最近窗口內每秒解析錯誤數")
+_hit_ratio_gauge = registry.gauge("kafka_consumer_filter_hit_ratio", "最近窗口內 PoolMigrateEvent 佔比")
+_dispatch_latency = registry.histogram("kafka_consumer_dispatch_seconds", "事件從 Kafka 寫入到被 API 接收的耗時")
+_messages_meter = RateMeter()
+_target_meter = RateMeter()
+_decode_errors_meter = RateMeter()
 
 
-async def _post_tg_push(session: aiohttp.ClientSession, token_address: str, network: str) -> None:
+def _event_age_seconds(event_ts: Optional[int]) -> Optional[float]:
+    if not event_ts or event_ts <= 0:
+        return None
+    return max(0.0, time.time() - event_ts / 1000.0)
+
+
+async def _post_tg_push(
+    session: aiohttp.ClientSession,
+    token_address: str,
+    network: str,
+    event_ts: Optional[int] = None,
+    trace_id: Optional[str] = None,
+) -> bool:
+    """提交到 /api/tg_push，返回是否已被接收（入隊、處理中、冪等命中、參數無效均視為已接收）。"""
     url = f"{API_SCHEME}://{API_HOST}:{API_PORT}/api/tg_push"
     payload = {"token_address": token_address, "chain": network}
+    if event_ts:
+        # 事件時間（毫秒），用於統計事件到 Telegram 發送的端到端延遲
+        payload["event_ts"] = event_ts
+    if trace_id:
+        # 追蹤 ID 由消費端生成，API 側的處理時間線沿用同一 ID
+        payload["trace_id"] = trace_id
     try:
-        async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                logger.error(f"tg_push 失敗: HTTP {resp.status}, body={text[:300]}")
-            else:
-                logger.info(f"已提交高頻推送請求: {token_address} ({network})")
+        async with session.post(url, json=payload, timeout=timeout_for("internal")) as resp:
+            if resp.status == 200:
+                logger.info(f"已提交高頻推送請求: {token_address} ({network}), trace={trace_id}")
+                return True
+            text = await resp.text()
+            if resp.status == 400:
+                # 參數無效，重試也不會成功，直接丟棄
+                logger.error(f"tg_push 拒絕（不重試）: HTTP {resp.status}, body={text[:300]}")
+                return True
+            logger.error(f"tg_push 失敗: HTTP {resp.status}, body={text[:300]}")
+            return False
     except Exception as e:
         logger.error(f"請求 /api/tg_push 異常: {e}")
+        return False
+
+
+async def _http_dispatch(
+    token_address: str, network: str, event_ts: Optional[int] = None, trace_id: Optional[str] = None
+) -> bool:
+    return await _post_tg_push(get_http_session(), token_address, network, event_ts, trace_id)
+
+
+class OffsetTracker:
+    """按分區記錄未確認的 offset，只把 offset 推進到連續已確認的位置（at-least-once）。
+
+    消息可亂序完成；某條消息未確認前，其後的消息即使完成也不會被提交。
+    """
+
+    def __init__(self, max_inflight: int = KAFKA_MAX_INFLIGHT_PER_PARTITION):
+        self.max_inflight = max(1, int(max_inflight))
+        # 每分區按 offset 順序排列的 [offset, done]
+        self._pending: Dict[TopicPartition, Deque[List[Any]]] = {}
+        self._index: Dict[Tuple[TopicPartition, int], List[Any]] = {}
+        self._committed: Dict[TopicPartition, int] = {}
+
+    def add(self, tp: TopicPartition, offset: int) -> None:
+        entry = [offset, False]
+        self._pending.setdefault(tp, deque()).append(entry)
+        self._index[(tp, offset)] = entry
+
+    def done(self, tp: TopicPartition, offset: int) -> None:
+        entry = self._index.pop((tp, offset), None)
+        if entry is not None:
+            entry[1] = True
+
+    def inflight(self, tp: TopicPartition) -> int:
+        return len(self._pending.get(tp, ()))
+
+    def over_window(self) -> Set[TopicPartition]:
+        return {tp for tp, pending in self._pending.items() if len(pending) >= self.max_inflight}
+
+    def committable(self) -> Dict[TopicPartition, int]:
+        """彈出各分區開頭已確認的消息，返回需要提交的 {分區: 下一個待消費 offset}。"""
+        offsets: Dict[TopicPartition, int] = {}
+        for tp, pending in self._pending.items():
+            last_done = None
+            while pending and pending[0][1]:
+                last_done = pending.popleft()[0]
+            if last_done is not None and last_done + 1 > self._committed.get(tp, -1):
+                offsets[tp] = last_done + 1
+        return offsets
+
+    def mark_committed(self, offsets: Dict[TopicPartition, int]) -> None:
+        self._committed.update(offsets)
+
+    def forget(self, partitions) -> None:
+        """分區被回收後丟棄其狀態（未確認的消息將由新的持有者重新消費）。"""
+        for tp in partitions:
+            for offset, _ in self._pending.pop(tp, ()):
+                self._index.pop((tp, offset), None)
+            self._committed.pop(tp, None)
+
+    def committed(self, tp: TopicPartition) -> Optional[int]:
+        return self._committed.get(tp)
+
+    def first_pending(self, tp: TopicPartition) -> Optional[int]:
+        pending = self._pending.get(tp)
+        return pending[0][0] if pending else None
+
+    def stats(self) -> Dict[str, int]:
+        return {f"{tp.topic}-{tp.partition}": len(pending) for tp, pending in self._pending.items()}
+
+
+def parse_pool_migrate_event(raw: Any) -> Optional[Tuple[str, str]]:
+    """解析消息負載，返回 (token_address, network)；非目標事件或無地址返回 None。"""
+    if isinstance(raw, (bytes, bytearray)):
+        # 先做字節級預檢，絕大多數非目標事件無需解析 JSON
+        if _TARGET_EVENT_TYPE_BYTES not in raw:
+            return None
+        raw = raw.decode("utf-8", errors="ignore")
+    elif isinstance(raw, str) and TARGET_EVENT_TYPE not in raw:
+        return None
+    data = json.loads(raw)
+
+    event = data.get("event") or data
+    event_type = event.get("type") or data.get("type")
+    if event_type != TARGET_EVENT_TYPE:
+        return None
+
+    token_address = (
+        (event.get("tokenAddress") or event.get("token_address") or "").strip()
+    )
+    network = (event.get("network") or "").strip() or "SOLANA"
+    if not token_address:
+        return None
+    return token_address, network
+
+
+class _PendingEvent:
+    """一個待派發的事件及其對應的全部消息 offset"""
+
+    __slots__ = ("offsets", "event_ts", "trace_id")
+
+    def __init__(self, event_ts: Optional[int]):
+        self.offsets: List[Tuple[TopicPartition, int]] = []
+        # 合併事件取最早的消息時間
+        self.event_ts = event_ts
+        # 合併事件沿用首個事件的追蹤 ID
+        self.trace_id = new_trace_id()
+
+    def merge(self, other: "_PendingEvent") -> None:
+        self.offsets.extend(other.offsets)
+        if other.event_ts and (not self.event_ts or other.event_ts < self.event_ts):
+            self.event_ts = other.event_ts
+
+
+def _collect_batch(
+    batch: Dict[TopicPartition, List[Any]], tracker: OffsetTracker
+) -> Dict[Tuple[str, str], _PendingEvent]:
+    """登記一次 getmany 的全部 offset，並取出目標事件。
+
+    非目標/不可解析的消息直接確認；目標事件按 (network, token_address) 批內去重，
+    事件被接收後其全部 offset 才會確認。
+    """
+    events: Dict[Tuple[str, str], _PendingEvent] = {}
+    for tp, records in batch.items():
+        _messages_total.inc(len(records), topic=tp.topic)
+        _messages_meter.mark(len(records))
+        for msg in records:
+            tracker.add(tp, msg.offset)
+            try:
+                parsed = parse_pool_migrate_event(msg.value)
+            except json.JSONDecodeError:
+                logger.warning("忽略不可解析的消息負載（非 JSON）")
+                _decode_errors_total.inc(topic=tp.topic)
+                _decode_errors_meter.mark()
+                parsed = None
+            except Exception as e:
+                logger.error(f"處理消息異常: {e}")
+                _decode_errors_total.inc(topic=tp.topic)
+                _decode_errors_meter.mark()
+                parsed = None
+            if parsed is None:
+                tracker.done(tp, msg.offset)
+                continue
+            _target_events_total.inc(topic=tp.topic)
+            _target_meter.mark()
+            token_address, network = parsed
+            key = (network, token_address)
+            event_ts = msg.timestamp if isinstance(msg.timestamp, int) and msg.timestamp > 0 else None
+            pending = events.get(key)
+            if pending is not None:
+                _batch_deduped_total.inc()
+                logger.debug(f"批內重複事件已合併: token={token_address}, network={network}")
+                if event_ts and (not pending.event_ts or event_ts < pending.event_ts):
+                    pending.event_ts = event_ts
+            else:
+                pending = events[key] = _PendingEvent(event_ts)
+                logger.info(
+                    f"收到 PoolMigrateEvent: token={token_address}, network={network}, partition={msg.partition}, "
+                    f"offset={msg.offset}, trace={pending.trace_id}"
+                )
+            pending.offsets.append((tp, msg.offset))
+    return events
+
+
+class _Dispatcher:
+    """在背景並發派發事件；派發失敗按退避重試直到成功，成功後確認對應 offset。
+
+    與進行中事件相同的新消息會合併到該事件上，不重複派發。
+    """
+
+    def __init__(self, dispatch: Dispatcher, tracker: OffsetTracker):
+        self._dispatch = dispatch
+        self._tracker = tracker
+        self._sem = asyncio.Semaphore(max(1, KAFKA_DISPATCH_CONCURRENCY))
+        self._inflight: Dict[Tuple[str, str], _PendingEvent] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, events: Dict[Tuple[str, str], _PendingEvent]) -> None:
+        for key, event in events.items():
+            if key in self._inflight:
+                _batch_deduped_total.inc()
+                self._inflight[key].merge(event)
+                continue
+            self._inflight[key] = event
+            task = asyncio.create_task(self._run(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Tuple[str, str]) -> None:
+        network, token_address = key
+        delay = KAFKA_DISPATCH_RETRY_BASE_SECONDS
+        try:
+            while True:
+                async with self._sem:
+                    try:
+                        event = self._inflight[key]
+                        accepted = await self._dispatch(token_address, network, event.event_ts, event.trace_id)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.error(f"派發高頻推送失敗: {token_address} ({network}), err={e}")
+                        accepted = False
+                if accepted:
+                    break
+                _dispatch_total.inc(result="retry")
+                logger.warning(f"高頻推送未被接收，{delay:.0f}s 後重試: {token_address} ({network})")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, KAFKA_DISPATCH_RETRY_MAX_SECONDS)
+            event = self._inflight[key]
+            _dispatch_total.inc(result="accepted")
+            age = _event_age_seconds(event.event_ts)
+            if age is not None:
+                _dispatch_latency.observe(age)
+            for tp, offset in event.offsets:
+                self._tracker.done(tp, offset)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def close(self) -> None:
+        """取消未完成的派發（其 offset 未提交，重啟後會重新消費）。"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+def _update_consumer_metrics(consumer: AIOKafkaConsumer, tracker: OffsetTracker) -> None:
+    """刷新分區積壓與速率指標（highwater 取自最近一次拉取，無額外網絡請求）。"""
+    for tp in consumer.assignment():
+        labels = {"topic": tp.topic, "partition": str(tp.partition)}
+        _inflight_gauge.set(tracker.inflight(tp), **labels)
+        highwater = consumer.highwater(tp)
+        if highwater is None:
+            continue
+        position = tracker.committed(tp)
+        if position is None:
+            position = tracker.first_pending(tp)
+        if position is not None:
+            _lag_gauge.set(max(0, highwater - position), **labels)
+    messages_rate = _messages_meter.rate()
+    _messages_rate_gauge.set(round(messages_rate, 3))
+    _decode_errors_rate_gauge.set(round(_decode_errors_meter.rate(), 3))
+    _hit_ratio_gauge.set(round(_target_meter.rate() / messages_rate, 4) if messages_rate > 0 else 0)
+
+
+def _forget_partition_metrics(partitions) -> None:
+    for tp in partitions:
+        labels = {"topic": tp.topic, "partition": str(tp.partition)}
+        _lag_gauge.remove(**labels)
+        _inflight_gauge.remove(**labels)
+
+
+async def _commit(consumer: AIOKafkaConsumer, tracker: OffsetTracker) -> None:
+    offsets = tracker.committable()
+    if not offsets:
+        return
+    try:
+        await consumer.commit(offsets)
+        tracker.mark_committed(offsets)
+    except Exception as e:
+        # 提交失敗不影響正確性：下次提交會帶上更新的 offset；最壞情況重放（冪等鍵去重）
+        logger.warning(f"提交 Kafka offset 失敗: {e}")
+
+
+class _RebalanceListener(ConsumerRebalanceListener):
+    def __init__(self, consumer: AIOKafkaConsumer, tracker: OffsetTracker):
+        self._consumer = consumer
+        self._tracker = tracker
+
+    async def on_partitions_revoked(self, revoked):
+        # 回收前提交已確認的部分，減少新持有者的重放量
+        await _commit(self._consumer, self._tracker)
+        self._tracker.forget(revoked)
+        _forget_partition_metrics(revoked)
+
+    async def on_partitions_assigned(self, assigned):
+        self._tracker.forget(assigned)
+        logger.info(f"Kafka 分區分配: {sorted(f'{tp.topic}-{tp.partition}' for tp in assigned)}")
 
 
 def _build_consumer(loop: asyncio.AbstractEventLoop) -> AIOKafkaConsumer:
@@ -57,7 +403,8 @@ def _build_consumer(loop: asyncio.AbstractEventLoop) -> AIOKafkaConsumer:
         "loop": loop,
         "bootstrap_servers": KAFKA_BOOTSTRAP_SERVERS,
         "group_id": KAFKA_GROUP_ID,
-        "enable_auto_commit": True,
+        # 手動提交：只有被接收的事件 offset 才會推進
+        "enable_auto_commit": False,
         "auto_offset_reset": KAFKA_AUTO_OFFSET_RESET,
         "security_protocol": KAFKA_SECURITY_PROTOCOL,
     }
@@ -68,55 +415,49 @@ def _build_consumer(loop: asyncio.AbstractEventLoop) -> AIOKafkaConsumer:
             kwargs["sasl_plain_username"] = KAFKA_SASL_USERNAME
         if KAFKA_SASL_PASSWORD is not None:
             kwargs["sasl_plain_password"] = KAFKA_SASL_PASSWORD
-    return AIOKafkaConsumer(*KAFKA_TOPICS, **kwargs)
+    return AIOKafkaConsumer(**kwargs)
 
 
-async def _consume_loop() -> None:
+async def _consume_loop(dispatch: Dispatcher) -> None:
     while True:
         loop = asyncio.get_running_loop()
         consumer = _build_consumer(loop)
+        tracker = OffsetTracker()
+        dispatcher = _Dispatcher(dispatch, tracker)
         try:
+            consumer.subscribe(topics=KAFKA_TOPICS, listener=_RebalanceListener(consumer, tracker))
             await consumer.start()
             logger.info(
-                f"Kafka 高頻消費啟動：topics={KAFKA_TOPICS}, group={KAFKA_GROUP_ID}, servers={KAFKA_BOOTSTRAP_SERVERS}"
+                f"Kafka 高頻消費啟動：topics={KAFKA_TOPICS}, group={KAFKA_GROUP_ID}, servers={KAFKA_BOOTSTRAP_SERVERS}, max_records={KAFKA_MAX_RECORDS}"
             )
 
-            http_timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=http_timeout) as session:
-                async for msg in consumer:
-                    try:
-                        payload = msg.value
-                        if isinstance(payload, (bytes, bytearray)):
-                            payload = payload.decode("utf-8", errors="ignore")
-                        data = json.loads(payload)
-
-                        event = data.get("event") or data
-                        event_type = event.get("type") or data.get("type")
-                        if event_type != TARGET_EVENT_TYPE:
-                            continue
-
-                        token_address = (
-                            (event.get("tokenAddress") or event.get("token_address") or "").strip()
-                        )
-                        network = (event.get("network") or "").strip() or "SOLANA"
-                        if not token_address:
-                            continue
-
-                        logger.info(
-                            f"收到 PoolMigrateEvent: token={token_address}, network={network}, partition={msg.partition}, offset={msg.offset}"
-                        )
-                        await _post_tg_push(session, token_address, network)
-                    except json.JSONDecodeError:
-                        logger.warning("忽略不可解析的消息負載（非 JSON）")
-                    except Exception as e:
-                        logger.error(f"處理消息異常: {e}")
+            paused: Set[TopicPartition] = set()
+            while True:
+                batch = await consumer.getmany(timeout_ms=KAFKA_POLL_TIMEOUT_MS, max_records=KAFKA_MAX_RECORDS)
+                if batch:
+                    dispatcher.submit(_collect_batch(batch, tracker))
+                await _commit(consumer, tracker)
+                _update_consumer_metrics(consumer, tracker)
+
+                # 未確認消息超過窗口的分區暫停拉取，回落後恢復，限制內存佔用
+                over = tracker.over_window() & consumer.assignment()
+                to_pause = over - paused
+                to_resume = (paused - over) & consumer.assignment()
+                if to_pause:
+                    consumer.pause(*to_pause)
+                    logger.warning(f"分區未確認消息達到上限，暫停拉取: {tracker.stats()}")
+                if to_resume:
+                    consumer.resume(*to_resume)
+                paused = over
         except asyncio.CancelledError:
             # 任務被取消，正常退出
             raise
         except Exception as e:
             logger.error(f"高頻消費循環發生異常，3秒後重啟: {e}", exc_info=True)
         finally:
+            await dispatcher.close()
             try:
+                await _commit(consumer, tracker)
                 await consumer.stop()
                 logger.info("Kafka 高頻消費已停止")
             except Exception:
@@ -124,17 +465,24 @@ async def _consume_loop() -> None:
         await asyncio.sleep(3)
 
 
-async def start_kafka_consumer() -> None:
-    global _consumer_task
+async def start_kafka_consumer(dispatch: Optional[Dispatcher] = None) -> None:
+    """啟動消費任務。dispatch 為空時經 HTTP 提交到 /api/tg_push；
+    與隊列同進程時傳入入隊函數即可直接入隊。"""
+    global _consumer_task, _metrics_runner
     if _consumer_task and not _consumer_task.done():
         logger.info("Kafka 高頻消費任務已在運行，跳過啟動")
         return
-    _consumer_task = asyncio.create_task(_consume_loop())
-    logger.info("Kafka 高頻消費任務已啟動 (background task)")
+    if KAFKA_METRICS_PORT > 0 and _metrics_runner is None:
+        _metrics_runner = await start_metrics_server(KAFKA_METRICS_PORT)
+    mode = "in-process" if dispatch is not None else "http"
+    _consumer_task = asyncio.create_task(_consume_loop(dispatch or _http_dispatch))
+    logger.info(f"Kafka 高頻消費任務已啟動 (background task, dispatch={mode})")
 
 
 async def stop_kafka_consumer() -> None:
-    global _consumer_task
+    global _consumer_task, _metrics_runner
+    await stop_metrics_server(_metrics_runner)
+    _metrics_runner = None
     if _consumer_task:
         _consumer_task.cancel()
         try:
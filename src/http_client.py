@@ -0,0 +1,134 @@
+import os
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv(override=True)
+
+# 連接池配置（可透過環境變數覆蓋）
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "200"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "50"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30"))
+HTTP_DNS_CACHE_SECONDS = int(os.getenv("HTTP_DNS_CACHE_SECONDS", "300"))
+
+# 各上游的超時設定（秒）
+_TIMEOUT_PROFILES: Dict[str, aiohttp.ClientTimeout] = {
+    "es": aiohttp.ClientTimeout(total=int(os.getenv("ES_REQUEST_TIMEOUT", "3"))),
+    "es_scan": aiohttp.ClientTimeout(total=int(os.getenv("ES_SCAN_REQUEST_TIMEOUT", "20"))),
+    "solscan": aiohttp.ClientTimeout(total=int(os.getenv("SOLSCAN_REQUEST_TIMEOUT", "3"))),
+    "smart_money": aiohttp.ClientTimeout(total=int(os.getenv("SMART_MONEY_REQUEST_TIMEOUT", "5"))),
+    "socials": aiohttp.ClientTimeout(total=int(os.getenv("SOCIALS_REQUEST_TIMEOUT", "5"))),
+    "internal": aiohttp.ClientTimeout(total=int(os.getenv("INTERNAL_REQUEST_TIMEOUT", "10"))),
+    "default": aiohttp.ClientTimeout(total=int(os.getenv("HTTP_DEFAULT_TIMEOUT", "30"))),
+}
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 連接池使用情況統計（事件循環單線程內累加，無需加鎖）
+_pool_counters: Dict[str, int] = {
+    "requests": 0,
+    "connections_created": 0,
+    "connections_reused": 0,
+    "queued_for_connection": 0,
+}
+
+
+def timeout_for(profile: str) -> aiohttp.ClientTimeout:
+    """取得指定上游的超時設定，未知名稱使用 default。"""
+    return _TIMEOUT_PROFILES.get(profile) or _TIMEOUT_PROFILES["default"]
+
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        _pool_counters["requests"] += 1
+
+    async def on_connection_create_end(session, ctx, params):
+        _pool_counters["connections_created"] += 1
+
+    async def on_connection_reuseconn(session, ctx, params):
+        _pool_counters["connections_reused"] += 1
+
+    async def on_connection_queued_start(session, ctx, params):
+        # 連接池已滿，請求需要排隊等待空閒連接
+        _pool_counters["queued_for_connection"] += 1
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    return trace_config
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """取得進程內共享的 aiohttp session（首次調用時建立）。
+
+    session 綁定到建立它的事件循環；若循環已變更（例如重新 asyncio.run），會重新建立。
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+            use_dns_cache=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout_for("default"),
+            trace_configs=[_build_trace_config()],
+        )
+        _session_loop = loop
+        logger.info(
+            f"共享 HTTP 連接池已建立: limit={HTTP_POOL_LIMIT}, limit_per_host={HTTP_POOL_LIMIT_PER_HOST}, keepalive={HTTP_KEEPALIVE_SECONDS}s"
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """關閉共享 session（應在進程退出前調用）。"""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("共享 HTTP 連接池已關閉")
+    _session = None
+    _session_loop = None
+
+
+def pool_stats() -> Dict[str, Any]:
+    """返回連接池飽和度指標。"""
+    stats: Dict[str, Any] = {
+        "limit": HTTP_POOL_LIMIT,
+        "limit_per_host": HTTP_POOL_LIMIT_PER_HOST,
+        "in_use": 0,
+        "idle": 0,
+        "in_use_per_host": {},
+        **_pool_counters,
+    }
+    if _session is None or _session.closed:
+        return stats
+    connector = _session.connector
+    try:
+        acquired = getattr(connector, "_acquired", None)
+        if acquired is not None:
+            stats["in_use"] = len(acquired)
+        per_host = getattr(connector, "_acquired_per_host", None) or {}
+        stats["in_use_per_host"] = {
+            f"{key.host}:{key.port}": len(conns) for key, conns in per_host.items() if conns
+        }
+        idle_conns = getattr(connector, "_conns", None) or {}
+        stats["idle"] = sum(len(conns) for conns in idle_conns.values())
+    except Exception as e:
+        logger.debug(f"讀取連接池統計失敗: {e}")
+    if HTTP_POOL_LIMIT > 0:
+        stats["saturation"] = round(stats["in_use"] / HTTP_POOL_LIMIT, 4)
+    return stats
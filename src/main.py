@@ -1,6 +1,5 @@
 import os
 import json
-import httpx
 import logging
 import hashlib
 import time
@@ -9,17 +8,23 @@ import traceback
 from typing import Dict, Optional
 from dotenv import load_dotenv
 from logging_setup import setup_logging
-import redis
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, Bot
-from telegram.ext import Application, CommandHandler, ContextTypes, Defaults
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import Application, CommandHandler, ContextTypes
 from telegram.error import NetworkError, TimedOut, RetryAfter
-from templates import format_message, load_templates, format_premium_message
-from high_freq_consumer import start_kafka_consumer
+from templates import get_button_labels, MessageRenderCache
+from token_snapshot import TokenSnapshot
+from high_freq_consumer import start_kafka_consumer, HIGH_FREQ_CONSUMER_IN_PROCESS
 from heat_scheduler import start_scheduler, stop_scheduler
+from http_client import close_http_session
+from telegram_client import get_bot, close_bot
+from telegram_rate_limit import telegram_rate_limiter
+import redis_client
+import tracing
+from metrics import registry, dedupe_checks_total
 
 # 導入自定義模型和數據庫函數
 import models
-from utils import get_additional_channels
+from utils import get_additional_channels, channel_directory
 
 # 載入環境變數
 load_dotenv(override=True)
@@ -68,6 +73,12 @@ if not GROUP_ID or not TOPIC_ID:
 # 全局 bot 應用實例
 bot_app = None
 
+# Telegram 發送指標：每次 send_message 嘗試的耗時與結果（按 chat 區分）
+telegram_send_seconds = registry.histogram(
+    "telegram_send_seconds", "Telegram send_message 單次嘗試耗時", ["chat", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30),
+)
+
 # 本地重複推送去重（僅進程內，避免網絡超時重試造成重複消息）
 DEDUP_WINDOW_SECONDS = int(os.getenv("DEDUP_WINDOW_SECONDS", "180"))
 _recent_send_keys = {}
@@ -110,36 +121,27 @@ def init_bot():
     return bot_app
 
 # 加密貨幣數據處理
-def fetch_crypto_data() -> Dict:
+def fetch_crypto_data() -> TokenSnapshot:
     """從 API 獲取加密貨幣數據"""
     # 模擬從 API 拉取數據
-    data = {
-        "token_symbol": "BBL(BBL Sheep)",
-        "chain": "Solana",
-        "token_address": "GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump",
-        "market_cap": 540700,
-        "price": 0.00067,
-        "holders": 234,
-        "launch_time": "2015.12.01 01:23:55",
-        "smart_money_activity": "15分钟内3名聪明钱交易",
-        "contract_security": json.dumps({
-            "authority": False,
-            "rug_pull": False,
-            "burn_pool": False,
-            "blacklist": True
-        }),
-        "top10_holding": 23.17,
-        "dev_holding_at_launch": 10.12,
-        "dev_holding_current": 23.12,
-        "dev_wallet_balance": 3.12,
-        "socials": json.dumps({
-            "twitter": False,
-            "website": True,
-            "telegram": True,
-            "twitter_search": True
-        })
-    }
-    return data
+    return TokenSnapshot(
+        token_address="GKuH7SzV6mYc3RmAsYF7sit7QMfK6oj1c1BP59hQpump",
+        token_name="BBL(BBL Sheep)",
+        token_symbol="BBL(BBL Sheep)",
+        chain="Solana",
+        market_cap=540700,
+        price=0.00067,
+        holders=234,
+        # 2015.12.01 01:23:55 (UTC+8)
+        launch_ts=1448904235,
+        smart_money_activity="15分钟内3名聪明钱交易",
+        security={"authority": False, "rug_pull": False, "burn_pool": False, "blacklist": True},
+        top10_holding=23.17,
+        dev_holding_at_launch=10.12,
+        dev_holding_current=23.12,
+        dev_wallet_balance=3.12,
+        telegram=True,
+    )
 
 async def push_to_channel(
     context: ContextTypes.DEFAULT_TYPE,
@@ -153,12 +155,10 @@ async def push_to_channel(
     max_send_retries: int = 3,
     token_address_override: Optional[str] = None,
 ) -> bool:
-    """推送消息到指定頻道或主題，带有重试机制"""
-    should_close_session = False
-    if session is None:
-        session = await models.get_session()
-        should_close_session = True
+    """推送消息到指定頻道或主題，带有重试机制
 
+    推送歷史寫入 models.push_history_buffer 批量落庫；session 參數僅為兼容舊調用保留。
+    """
     try:
         # 解析目標對象（優先使用顯式參數，其次環境變數，最後默認頻道）
         USE_TOPIC = False
@@ -206,61 +206,46 @@ async def push_to_channel(
                     break
 
         # 分佈式冪等：同一 chat/thread 在 TTL 內只發一次（優先以 token，否則以 message hash）
-        try:
-            REDIS_HOST = os.getenv("REDIS_HOST")
-            if REDIS_HOST:
-                r = getattr(push_to_channel, "_redis_client", None)
-                if r is None:
-                    r = redis.Redis(
-                        host=REDIS_HOST,
-                        port=int(os.getenv("REDIS_PORT", "6379")),
-                        password=os.getenv("REDIS_PASSWORD"),
-                        db=int(os.getenv("REDIS_DB", "0")),
-                        decode_responses=True,
-                        socket_timeout=2,
-                    )
-                    setattr(push_to_channel, "_redis_client", r)
-                chat_dedupe_ttl = int(os.getenv("CHAT_DEDUP_TTL_SECONDS", "300"))
-                # 使用 token_address 作為主鍵，缺失時退回 message hash
-                if token_address:
-                    unique_id = token_address
-                    chat_key = f"chatpush:idemp:{resolved_chat_id}:{resolved_topic_id or '0'}:{token_address}"
-                else:
-                    # Fallback：以 message hash 去重，避免模板偶發缺少 <code>
-                    msg_hash = hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
-                    unique_id = msg_hash
-                    chat_key = f"chatpush:msghash:{resolved_chat_id}:{resolved_topic_id or '0'}:{msg_hash}"
-                # 已發布標記（僅在成功後設置），用於避免同一次呼叫內因網路超時而二次發送
-                published_key = f"chatpush:published:{resolved_chat_id}:{resolved_topic_id or '0'}:{unique_id}"
-                # message_id 緩存鍵（成功後設置）
-                msgid_key = f"chatpush:msgid:{resolved_chat_id}:{resolved_topic_id or '0'}:{unique_id}"
-                # 若已發布，直接略過
-                try:
-                    if r.exists(published_key):
-                        logger.info(
-                            f"跳過重複消息（已發布標記命中） chat={resolved_chat_id} thread={resolved_topic_id if USE_TOPIC else ''} key={published_key}"
-                        )
-                        return True
-                except Exception:
-                    pass
-                # 任務級冪等：短時間內相同 chat/thread+token 僅允許一次入場
-                if not r.set(name=chat_key, value="1", nx=True, ex=chat_dedupe_ttl):
-                    logger.info(
-                        f"跳過重複消息（Redis 冪等命中） chat={resolved_chat_id} thread={resolved_topic_id if USE_TOPIC else ''} key={chat_key}"
-                    )
-                    return True
-        except Exception:
-            # 忽略 Redis 失敗，繼續後續流程
-            pass
+        chat_dedupe_ttl = int(os.getenv("CHAT_DEDUP_TTL_SECONDS", "300"))
+        # 使用 token_address 作為主鍵，缺失時退回 message hash
+        if token_address:
+            unique_id = token_address
+            chat_key = f"chatpush:idemp:{resolved_chat_id}:{resolved_topic_id or '0'}:{token_address}"
+        else:
+            # Fallback：以 message hash 去重，避免模板偶發缺少 <code>
+            msg_hash = hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
+            unique_id = msg_hash
+            chat_key = f"chatpush:msghash:{resolved_chat_id}:{resolved_topic_id or '0'}:{msg_hash}"
+        # 已發布標記（僅在成功後設置），用於避免同一次呼叫內因網路超時而二次發送
+        published_key = f"chatpush:published:{resolved_chat_id}:{resolved_topic_id or '0'}:{unique_id}"
+        # message_id 緩存鍵（成功後設置）
+        msgid_key = f"chatpush:msgid:{resolved_chat_id}:{resolved_topic_id or '0'}:{unique_id}"
+        # 已發布檢查與任務級冪等佔用在一次 Lua 調用內完成；Redis 不可用時返回 None，繼續後續流程
+        claim = await redis_client.claim_chat_push(published_key, msgid_key, chat_key, chat_dedupe_ttl)
+        dedupe_checks_total.inc(
+            family="chatpush",
+            result="unavailable" if claim is None else ("miss" if claim == "claimed" else "hit"),
+        )
+        if claim in ("published", "duplicate"):
+            tracing.mark("telegram_skip", chat=str(resolved_chat_id), reason=claim)
+        if claim == "published":
+            logger.info(
+                f"跳過重複消息（已發布標記命中） chat={resolved_chat_id} thread={resolved_topic_id if USE_TOPIC else ''} key={published_key}"
+            )
+            return True
+        if claim == "duplicate":
+            logger.info(
+                f"跳過重複消息（Redis 冪等命中） chat={resolved_chat_id} thread={resolved_topic_id if USE_TOPIC else ''} key={chat_key}"
+            )
+            return True
 
         # 構建交易鏈接
         trade_url = f"https://www.bydfi.com/en/moonx/solana/token?address={token_address}"
 
         # 根據語言獲取按鈕文本
-        templates = load_templates()
-        lang_templates = templates.get(language, templates.get("en"))
-        trade_button_text = lang_templates.get("trade_button", "⚡️一键交易⬆️")
-        chart_button_text = lang_templates.get("chart_button", "👉查K线⬆️")
+        button_labels = get_button_labels(language)
+        trade_button_text = button_labels.trade
+        chart_button_text = button_labels.chart
 
         keyboard = [
             [
@@ -275,11 +260,12 @@ async def push_to_channel(
         retry_delay = 2
         success = False
         error_message = None
+        send_started_at = time.time()
 
         for attempt in range(max_retries):
             try:
-                # 使用 Bot 類直接創建實例
-                bot = Bot(token=BOT_TOKEN)
+                # 使用進程內共享的 Bot，復用已建立的連接
+                bot = await get_bot()
 
                 # 準備發送參數
                 message_params = {
@@ -293,33 +279,32 @@ async def push_to_channel(
                 if USE_TOPIC:
                     message_params['message_thread_id'] = int(resolved_topic_id)
                 
+                # 按全局/chat/群組限額排程，錯開扇出時的同時發送
+                await telegram_rate_limiter.acquire(resolved_chat_id)
+
                 # 發送消息
-                sent_msg = await bot.send_message(**message_params)
+                send_started = time.monotonic()
+                sent_outcome = "error"
+                try:
+                    sent_msg = await bot.send_message(**message_params)
+                    sent_outcome = "ok"
+                except (NetworkError, TimedOut):
+                    sent_outcome = "network_error"
+                    raise
+                except RetryAfter:
+                    sent_outcome = "retry_after"
+                    raise
+                finally:
+                    telegram_send_seconds.observe(
+                        time.monotonic() - send_started, chat=str(resolved_chat_id), outcome=sent_outcome
+                    )
 
                 log_message = f"消息已發送到{'主題 ' + resolved_topic_id + ' 在群組 ' + resolved_chat_id if USE_TOPIC else '頻道 ' + resolved_chat_id}"
                 # logger.info(log_message)
-                # 發送成功後，打上已發布標記，避免因隨後的超時/網路錯誤而重複發送
-                try:
-                    if REDIS_HOST:
-                        # 使用前面計算的 published_key；若未定義則臨時生成一次
-                        if 'published_key' not in locals():
-                            ident = token_address or hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
-                            published_key = f"chatpush:published:{resolved_chat_id}:{resolved_topic_id or '0'}:{ident}"
-                        r = getattr(push_to_channel, "_redis_client", None)
-                        if r is not None:
-                            r.set(name=published_key, value="1", ex=chat_dedupe_ttl)
-                            # 緩存 message_id 以供之後重試檢查
-                            try:
-                                msg_id_val = getattr(sent_msg, 'message_id', None)
-                                if msg_id_val is not None:
-                                    if 'msgid_key' not in locals():
-                                        ident = token_address or hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
-                                        msgid_key = f"chatpush:msgid:{resolved_chat_id}:{resolved_topic_id or '0'}:{ident}"
-                                    r.set(name=msgid_key, value=str(msg_id_val), ex=chat_dedupe_ttl)
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+                # 發送成功後，打上已發布標記並緩存 message_id（單個 pipeline），避免因隨後的超時/網路錯誤而重複發送
+                await redis_client.mark_published(
+                    published_key, msgid_key, getattr(sent_msg, 'message_id', None), chat_dedupe_ttl
+                )
                 success = True
                 break  # 成功發送，跳出重試循環
 
@@ -329,21 +314,10 @@ async def push_to_channel(
                 target_desc = f"主題 {resolved_topic_id} 在群組 {resolved_chat_id}" if USE_TOPIC else f"頻道 {resolved_chat_id}"
                 logger.warning(f"第 {attempt+1} 次嘗試發送消息失敗[{target_desc}]: {error_message}，等待 {retry_delay} 秒後重試")
                 # 若前一次其實已成功送達（但回應超時），則已發布標記會存在，此時直接停止重試避免重複
-                try:
-                    if REDIS_HOST:
-                        if 'published_key' not in locals():
-                            ident = token_address or hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
-                            published_key = f"chatpush:published:{resolved_chat_id}:{resolved_topic_id or '0'}:{ident}"
-                        if 'msgid_key' not in locals():
-                            ident = token_address or hashlib.sha256(message.encode("utf-8")).hexdigest()[:16]
-                            msgid_key = f"chatpush:msgid:{resolved_chat_id}:{resolved_topic_id or '0'}:{ident}"
-                        r = getattr(push_to_channel, "_redis_client", None)
-                        if r is not None and (r.exists(published_key) or r.exists(msgid_key)):
-                            logger.info(f"檢測到已發布（published/msgid）標記，停止重試以避免重複：{published_key} | {msgid_key}")
-                            success = True
-                            break
-                except Exception:
-                    pass
+                if await redis_client.exists_any(published_key, msgid_key):
+                    logger.info(f"檢測到已發布（published/msgid）標記，停止重試以避免重複：{published_key} | {msgid_key}")
+                    success = True
+                    break
                 await asyncio.sleep(retry_delay)
                 retry_delay *= 2  # 指數退避策略
 
@@ -353,7 +327,8 @@ async def push_to_channel(
                 error_message = f"API 限流，需要等待 {retry_after} 秒"
                 target_desc = f"主題 {resolved_topic_id} 在群組 {resolved_chat_id}" if USE_TOPIC else f"頻道 {resolved_chat_id}"
                 logger.warning(f"第 {attempt+1} 次嘗試發送消息失敗[{target_desc}]: {error_message}")
-                await asyncio.sleep(retry_after)
+                # 冷卻作用於整個 chat：同一 chat 的其他待發消息也會順延，下一次嘗試由排程器等待
+                telegram_rate_limiter.penalize(resolved_chat_id, retry_after)
 
             except Exception as e:
                 # 其他錯誤
@@ -362,35 +337,37 @@ async def push_to_channel(
                 logger.error(f"無法發送消息到{target_desc}: {error_message}")
                 break  # 非預期錯誤，不重試
 
-        # 記錄推送歷史
+        trace = tracing.current_trace()
+        if trace is not None:
+            trace.add_span(
+                "telegram_send", send_started_at, time.time(),
+                chat=str(resolved_chat_id), thread=resolved_topic_id if USE_TOPIC else None,
+                attempts=attempt + 1, success=success,
+            )
+
+        # 記錄推送歷史（進入緩衝，由後台任務批量寫入）
         chat_id_for_history = f"{target_chat_id}_{TOPIC_ID}" if USE_TOPIC else target_chat_id
-        await models.add_push_history(
-            session,
+        models.push_history_buffer.add(
             message_content=message,
             chat_ids=json.dumps([chat_id_for_history]),
             crypto_id=crypto_id,
             status="success" if success else "failed",
             error_message=error_message
         )
-        # 立即提交，避免長事務
-        await session.commit()
         return success
     except Exception as e:
         logger.error(f"推送過程中發生錯誤: {e}")
-        await session.rollback()
         return False
-    finally:
-        if should_close_session:
-            try:
-                await session.close()
-            except Exception:
-                pass
 
-async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, crypto_data: Dict, session=None, is_low_frequency: bool = False) -> Dict[str, bool]:
+async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, snapshot: TokenSnapshot, session=None, is_low_frequency: bool = False) -> Dict[str, bool]:
     """並發向所有語言主題與額外頻道推送加密貨幣資訊。"""
     results: Dict[str, bool] = {}
     language_groups = json.loads(os.getenv("LANGUAGE_GROUPS", "{}"))
 
+    # 同一語言的消息只渲染一次，所有該語言的目標共用
+    render_cache = MessageRenderCache(snapshot, is_premium=is_low_frequency)
+    token_address = snapshot.token_address.strip()
+
     # 構造併發任務
     send_jobs = []  # (key, coroutine)
     visited_targets = set()  # 去重目標: "chat_id:thread_id"
@@ -419,17 +396,17 @@ async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, cryp
             # 同一輪內去重，避免 premium 情況下同一 chat/thread 重覆
             continue
         visited_targets.add(target_key)
-        msg = format_premium_message(crypto_data, language) if is_low_frequency else format_message(crypto_data, language)
+        msg = render_cache.get(language)
         send_jobs.append((language, push_to_channel(
             context,
             msg,
-            crypto_data.get("id"),
+            snapshot.id,
             session=None,  # 避免共享 session 併發問題
             language=language,
             target_group_id=group_id,
             target_topic_id=topic_id,
             max_send_retries=(1 if is_low_frequency else 3),
-            token_address_override=str(crypto_data.get("token_address") or crypto_data.get("contract_address") or "").strip(),
+            token_address_override=token_address,
         )))
 
     # 2) 額外頻道（API）
@@ -451,18 +428,18 @@ async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, cryp
                         logger.info(f"skip duplicate extra channel target in same round: {target_key}")
                         continue
                     visited_targets.add(target_key)
-                    msg = format_premium_message(crypto_data, lang) if is_low_frequency else format_message(crypto_data, lang)
+                    msg = render_cache.get(lang)
                     key = f"extra_{group_id}_{topic_id}"
                     send_jobs.append((key, push_to_channel(
                         context,
                         msg,
-                        crypto_data.get("id"),
+                        snapshot.id,
                         session=None,
                         language=lang,
                         target_group_id=group_id,
                         target_topic_id=topic_id,
                         max_send_retries=(1 if is_low_frequency else 3),
-                        token_address_override=str(crypto_data.get("token_address") or crypto_data.get("contract_address") or "").strip(),
+                        token_address_override=token_address,
                     )))
             else:
                 # 非字典，視為直接 chat_id
@@ -473,23 +450,23 @@ async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, cryp
                     logger.info(f"skip duplicate direct chat target in same round: {target_key}")
                     continue
                 visited_targets.add(target_key)
-                msg = format_premium_message(crypto_data, lang) if is_low_frequency else format_message(crypto_data, lang)
+                msg = render_cache.get(lang)
                 key = f"extra_{chat_id}"
                 send_jobs.append((key, push_to_channel(
                     context,
                     msg,
-                    crypto_data.get("id"),
+                    snapshot.id,
                     session=None,
                     language=lang,
                     target_chat_id=chat_id,
                     max_send_retries=(1 if is_low_frequency else 3),
-                    token_address_override=str(crypto_data.get("token_address") or crypto_data.get("contract_address") or "").strip(),
+                    token_address_override=token_address,
                 )))
         except Exception:
             # 忽略單一構建錯誤
             continue
 
-    # 併發執行
+    # 併發執行（實際發送時間由 telegram_rate_limiter 按限額錯開）
     if send_jobs:
         keys = [k for k, _ in send_jobs]
         coros = [c for _, c in send_jobs]
@@ -500,7 +477,9 @@ async def push_to_all_language_channels(context: ContextTypes.DEFAULT_TYPE, cryp
     # 總結
     success_count = sum(1 for v in results.values() if v)
     total_count = len(results)
-    logger.info(f"多語言+額外頻道推送完成(並發): 成功 {success_count}/{total_count}")
+    logger.info(
+        f"多語言+額外頻道推送完成(並發): 成功 {success_count}/{total_count}, 消息渲染 {render_cache.misses} 次（復用 {render_cache.hits} 次）"
+    )
     return results
 
 async def test_multilang(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -521,7 +500,7 @@ async def test_multilang(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 return
             
             # 設置 ID
-            data["id"] = crypto_id
+            data.id = crypto_id
             
             # 推送到所有語言主題
             results = await push_to_all_language_channels(context, data, session)
@@ -601,6 +580,15 @@ async def main():
         await bot_app.start()
         logger.info("Bot 啟動完成，開始輪詢...")
 
+        # 推送歷史批量寫入任務
+        models.push_history_buffer.start()
+
+        # 預先建立推送用的共享 Bot 與連接池
+        try:
+            await get_bot()
+        except Exception as e:
+            logger.error(f"初始化推送 Bot 失敗: {e}")
+
         # 啟動熱度排程（背景任務）
         try:
             await start_scheduler()
@@ -617,11 +605,14 @@ async def main():
         await bot_app.updater.start_polling(**polling_options)
         logger.info("Bot 輪詢已啟動")
 
-        # 啟動 Kafka 高頻消費任務
-        try:
-            await start_kafka_consumer()
-        except Exception as e:
-            logger.error(f"啟動 Kafka 高頻消費任務失敗: {e}")
+        # 啟動 Kafka 高頻消費任務（進程內模式下由 API 進程負責消費）
+        if HIGH_FREQ_CONSUMER_IN_PROCESS:
+            logger.info("Kafka 高頻消費由 API 進程內運行，此處跳過")
+        else:
+            try:
+                await start_kafka_consumer()
+            except Exception as e:
+                logger.error(f"啟動 Kafka 高頻消費任務失敗: {e}")
 
         # 使用事件等待機制來保持運行
         stop_event = asyncio.Event()
@@ -651,6 +642,12 @@ async def main():
                 logger.info("正在關閉 bot...")
                 await bot_app.shutdown()
                 logger.info("Bot 已完全停止")
+
+            await models.push_history_buffer.close()
+            await channel_directory.close()
+            await close_bot()
+            await redis_client.close_redis()
+            await close_http_session()
         except Exception as e:
             logger.error(f"停止 Bot 時發生錯誤: {e}")
             logger.error(traceback.format_exc())
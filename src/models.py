@@ -1,14 +1,18 @@
 import os
 import logging
+import time
 import asyncio
-from typing import Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, insert
 from sqlalchemy.sql import text
 from sqlalchemy.future import select
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+from metrics import registry
+from token_snapshot import TokenSnapshot
 
 # 設置日誌
 logger = logging.getLogger(__name__)
@@ -28,6 +32,18 @@ _wallets_cache = {
 }
 _CACHE_EXPIRE_SECONDS = 24 * 60 * 60  # 24小時
 
+# 數據庫提交耗時（op 區分寫入來源）
+db_commit_seconds = registry.histogram(
+    "db_commit_seconds", "數據庫提交耗時", ["op", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+)
+
+# 推送歷史批量寫入：每隔 N 毫秒或累積 M 條觸發一次多行 INSERT
+PUSH_HISTORY_FLUSH_INTERVAL_MS = int(os.getenv("PUSH_HISTORY_FLUSH_INTERVAL_MS", "500"))
+PUSH_HISTORY_FLUSH_ROWS = int(os.getenv("PUSH_HISTORY_FLUSH_ROWS", "200"))
+# 數據庫不可用時內存中最多暫存的記錄數，超出則丟棄最舊的
+PUSH_HISTORY_SPOOL_MAX = int(os.getenv("PUSH_HISTORY_SPOOL_MAX", "10000"))
+
 def get_utc8_time():
     """獲取 UTC+8 當前時間"""
     return datetime.now(TZ_UTC8).replace(tzinfo=None)
@@ -144,63 +160,156 @@ async def create_tables():
         await conn.run_sync(Base.metadata.create_all)
     logger.info("所有資料表已創建")
 
-async def add_crypto_info(session, crypto_data: Dict) -> Optional[int]:
+async def add_crypto_info(session, snapshot: TokenSnapshot) -> Optional[int]:
     """將加密貨幣資訊添加到資料庫並返回 ID"""
     try:
         await session.execute(text("SET search_path TO dex_query_v1;"))
-        # 處理 launch_time
-        launch_time = crypto_data.get("launch_time")
-        if isinstance(launch_time, str):
-            try:
-                # 嘗試將日期字符串轉換為 datetime 對象
-                launch_time = datetime.strptime(launch_time, "%Y.%m.%d %H:%M:%S")
-            except ValueError:
-                launch_time = None
-        
         new_crypto = CryptoInfo(
-            token_name=crypto_data.get("token_symbol", ""),
-            chain=crypto_data.get("chain", ""),
-            contract_address=crypto_data.get("contract_address", ""),
-            market_cap=crypto_data.get("market_cap", 0.0),
-            price=crypto_data.get("price", 0.0),
-            holders=crypto_data.get("holders", 0),
-            launch_time=launch_time,
-            smart_money_activity=crypto_data.get("smart_money_activity", ""),
-            contract_security=crypto_data.get("contract_security", "{}"),
-            top10_holding=crypto_data.get("top10_holding", 0.0),
-            dev_holding_at_launch=crypto_data.get("dev_holding_at_launch", 0.0),
-            dev_holding_current=crypto_data.get("dev_holding_current", 0.0),
-            dev_wallet_balance=crypto_data.get("dev_wallet_balance", 0.0),
-            socials=crypto_data.get("socials", "{}"),
+            token_name=snapshot.token_symbol,
+            chain=snapshot.chain,
+            contract_address=snapshot.contract_address,
+            market_cap=snapshot.market_cap,
+            price=snapshot.price,
+            holders=snapshot.holders,
+            launch_time=snapshot.launch_time,
+            smart_money_activity=snapshot.smart_money_activity,
+            contract_security=snapshot.contract_security_json,
+            top10_holding=snapshot.top10_holding,
+            dev_holding_at_launch=snapshot.dev_holding_at_launch,
+            dev_holding_current=snapshot.dev_holding_current,
+            dev_wallet_balance=snapshot.dev_wallet_balance,
+            socials=snapshot.socials_json,
             created_at=get_utc8_time(),
             updated_at=get_utc8_time()
         )
         session.add(new_crypto)
         await session.flush()  # 確保 ID 被生成
-        logger.info(f"添加加密貨幣資訊: {crypto_data['token_symbol']}")
+        logger.info(f"添加加密貨幣資訊: {snapshot.token_symbol}")
         return new_crypto.id
     except Exception as e:
         logger.error(f"添加加密貨幣資訊時發生錯誤: {str(e)}")
         return None
 
-async def add_push_history(session, message_content: str, chat_ids: str, crypto_id: int = None, status: str = "success", error_message: str = None) -> bool:
-    """記錄推送歷史"""
-    try:
-        new_history = PushHistory(
-            message_content=message_content,
-            chat_ids=chat_ids,
-            crypto_id=crypto_id,
-            push_time=get_utc8_time(),
-            status=status,
-            error_message=error_message
-        )
-        session.add(new_history)
-        logger.info(f"添加推送歷史記錄，加密貨幣 ID: {crypto_id}")
+class PushHistoryBuffer:
+    """推送歷史寫入緩衝。
+
+    add() 只寫入內存；後台任務每隔 flush_interval 或累積 flush_rows 條時，
+    以單條多行 INSERT 寫入 push_history。寫入失敗的記錄留在緩衝中等待下次重試，
+    緩衝有上限（spool_max），數據庫長時間不可用時丟棄最舊的記錄。
+    """
+
+    def __init__(self, flush_interval_ms: int, flush_rows: int, spool_max: int):
+        self._flush_interval = max(10, int(flush_interval_ms)) / 1000.0
+        self._flush_rows = max(1, int(flush_rows))
+        self._spool_max = max(self._flush_rows, int(spool_max))
+        self._rows: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._stats = {"added": 0, "flushed": 0, "batches": 0, "failed_batches": 0, "dropped": 0}
+
+    def start(self) -> None:
+        """啟動後台刷寫任務（需在事件循環內調用；重複調用無副作用）。"""
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="push_history_flush")
+
+    def add(self, message_content: str, chat_ids: str, crypto_id: int = None, status: str = "success", error_message: str = None) -> None:
+        """加入一條推送歷史（不等待數據庫）。"""
+        if len(self._rows) >= self._spool_max:
+            self._rows.popleft()
+            self._stats["dropped"] += 1
+        self._rows.append({
+            "message_content": message_content,
+            "chat_ids": chat_ids,
+            "crypto_id": crypto_id,
+            "push_time": get_utc8_time(),
+            "status": status,
+            "error_message": error_message,
+        })
+        self._stats["added"] += 1
+        if not self._closing:
+            self.start()
+        if len(self._rows) >= self._flush_rows and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        backoff = self._flush_interval
+        # 取消與喚醒同時發生時 wait_for 可能吞掉取消（Python 3.11），因此同時檢查 _closing
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            ok = await self.flush()
+            # 寫入失敗時逐步拉長間隔，避免在數據庫故障期間頻繁重試
+            backoff = self._flush_interval if ok else min(backoff * 2, 30.0)
+
+    async def flush(self) -> bool:
+        """把緩衝中的記錄分批寫入數據庫；任一批失敗即停止並保留剩餘記錄。"""
+        if not self._rows:
+            return True
+        if engine is None:
+            return False
+        async with self._flush_lock:
+            while self._rows:
+                # 先把本批從緩衝取出：等待 INSERT 期間 add() 觸發的丟棄只會作用於未寫入的記錄
+                count = min(self._flush_rows, len(self._rows))
+                batch: List[Dict[str, Any]] = [self._rows.popleft() for _ in range(count)]
+                start = time.monotonic()
+                try:
+                    async with engine.begin() as conn:
+                        await conn.execute(insert(PushHistory), batch)
+                except asyncio.CancelledError:
+                    self._requeue(batch)
+                    raise
+                except Exception as e:
+                    db_commit_seconds.observe(time.monotonic() - start, op="push_history", outcome="error")
+                    self._stats["failed_batches"] += 1
+                    self._requeue(batch)
+                    logger.error(f"批量寫入推送歷史失敗（{count} 條保留待重試，緩衝 {len(self._rows)} 條）: {e}")
+                    return False
+                db_commit_seconds.observe(time.monotonic() - start, op="push_history", outcome="ok")
+                self._stats["flushed"] += count
+                self._stats["batches"] += 1
         return True
-    except Exception as e:
-        logger.error(f"添加推送歷史時發生錯誤: {str(e)}")
-        return False
-    
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """寫入失敗的批次放回緩衝前端；超出上限時仍丟棄最舊的記錄。"""
+        self._rows.extendleft(reversed(batch))
+        while len(self._rows) > self._spool_max:
+            self._rows.popleft()
+            self._stats["dropped"] += 1
+
+    async def close(self) -> None:
+        """停止後台任務並盡量寫出剩餘記錄（進程退出前調用）。"""
+        self._closing = True
+        if self._task is not None:
+            if self._wakeup is not None:
+                self._wakeup.set()
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._rows and self._flush_lock is not None:
+            if await self.flush():
+                logger.info("推送歷史緩衝已寫出")
+            else:
+                logger.error(f"退出時仍有 {len(self._rows)} 條推送歷史未能寫入")
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "pending": len(self._rows)}
+
+
+push_history_buffer = PushHistoryBuffer(PUSH_HISTORY_FLUSH_INTERVAL_MS, PUSH_HISTORY_FLUSH_ROWS, PUSH_HISTORY_SPOOL_MAX)
+
 async def refresh_wallets_cache():
     """從資料庫查詢KOL、一般聰明錢、高淨值聰明錢，並更新快取"""
     async with await get_session() as session:
@@ -0,0 +1,236 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+load_dotenv(override=True)
+
+# Redis 配置（分佈式冪等）
+REDIS_HOST = os.getenv("REDIS_HOST")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))
+# 單次操作超時（秒）；超時即視為失敗，不阻塞調用方
+REDIS_OP_TIMEOUT = float(os.getenv("REDIS_OP_TIMEOUT", "0.5"))
+# 熔斷：連續失敗 N 次後熔斷，冷卻 M 秒後放行一次探測
+REDIS_BREAKER_FAILURES = int(os.getenv("REDIS_BREAKER_FAILURES", "5"))
+REDIS_BREAKER_RESET_SECONDS = float(os.getenv("REDIS_BREAKER_RESET_SECONDS", "10"))
+
+# 單次發送的 chat 級冪等檢查：已發布/已有 message_id 則返回 published；
+# 否則嘗試佔用 chat 鍵，成功返回 claimed，已被佔用返回 duplicate
+_CLAIM_CHAT_PUSH_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 1 or redis.call('EXISTS', KEYS[2]) == 1 then
+    return 'published'
+end
+if redis.call('SET', KEYS[3], '1', 'NX', 'EX', ARGV[1]) then
+    return 'claimed'
+end
+return 'duplicate'
+"""
+
+
+class CircuitBreaker:
+    """簡單熔斷器：closed → open（連續失敗）→ half_open（冷卻後放行一次探測）。"""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self._failure_threshold = max(1, int(failure_threshold))
+        self._reset_seconds = max(0.0, float(reset_seconds))
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.open_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened_at >= self._reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if not self._probing and time.monotonic() - self._opened_at >= self._reset_seconds:
+            # 冷卻結束，只放行一個探測請求
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    @property
+    def probing(self) -> bool:
+        return self._probing
+
+    def release_probe(self) -> None:
+        """探測請求被取消（未得出結果）：保持熔斷狀態，允許下一個請求重新探測。"""
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("Redis 熔斷恢復")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or (self._opened_at is None and self._failures >= self._failure_threshold):
+            if self._opened_at is None:
+                self.open_count += 1
+                logger.warning(f"Redis 連續失敗 {self._failures} 次，熔斷 {self._reset_seconds}s")
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+_client: Optional[aioredis.Redis] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_claim_script = None
+_breaker = CircuitBreaker(REDIS_BREAKER_FAILURES, REDIS_BREAKER_RESET_SECONDS)
+_op_counters: Dict[str, int] = {"ok": 0, "failed": 0, "skipped": 0}
+_UNAVAILABLE = object()
+# Redis 往返耗時（含超時/失敗），按操作區分
+_op_seconds = registry.histogram(
+    "redis_op_seconds", "Redis 單次操作往返耗時", ["op", "outcome"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """取得進程內共享的異步 Redis 客戶端（帶連接池）；未配置 REDIS_HOST 時返回 None。"""
+    global _client, _client_loop, _claim_script
+    if not REDIS_HOST:
+        return None
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        pool = aioredis.ConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            password=REDIS_PASSWORD,
+            db=REDIS_DB,
+            decode_responses=True,
+            max_connections=REDIS_POOL_MAX_CONNECTIONS,
+            socket_timeout=REDIS_OP_TIMEOUT,
+            socket_connect_timeout=REDIS_OP_TIMEOUT,
+        )
+        _client = aioredis.Redis(connection_pool=pool)
+        _client_loop = loop
+        _claim_script = _client.register_script(_CLAIM_CHAT_PUSH_LUA)
+    return _client
+
+
+async def close_redis() -> None:
+    """關閉共享 Redis 連接池（應在進程退出前調用）。"""
+    global _client, _client_loop, _claim_script
+    if _client is not None:
+        try:
+            await _client.aclose()
+        except Exception as e:
+            logger.warning(f"關閉 Redis 連接池時發生錯誤: {e}")
+    _client = None
+    _client_loop = None
+    _claim_script = None
+
+
+async def _run(op: str, fn: Callable[[aioredis.Redis], Awaitable[Any]], default: Any = None) -> Any:
+    """執行一次 Redis 操作：熔斷中或失敗時返回 default（fail-open），從不拋出。"""
+    r = get_redis()
+    if r is None:
+        return default
+    if not _breaker.allow():
+        _op_counters["skipped"] += 1
+        return default
+    # allow() 在探測期間只放行探測請求本身，因此此時 probing 為 True 即表示本次是探測
+    is_probe = _breaker.probing
+    start = time.monotonic()
+    try:
+        result = await asyncio.wait_for(fn(r), timeout=REDIS_OP_TIMEOUT)
+    except asyncio.CancelledError:
+        # 探測被取消（如 worker 關閉、請求取消）時必須歸還探測名額，否則熔斷器永遠停在 half_open
+        if is_probe:
+            _breaker.release_probe()
+        raise
+    except Exception as e:
+        _op_seconds.observe(time.monotonic() - start, op=op, outcome="error")
+        _breaker.record_failure()
+        _op_counters["failed"] += 1
+        logger.warning(f"Redis {op} 失敗（略過）: {e!r}")
+        return default
+    _op_seconds.observe(time.monotonic() - start, op=op, outcome="ok")
+    _breaker.record_success()
+    _op_counters["ok"] += 1
+    return result
+
+
+async def set_nx(key: str, ttl: int) -> Optional[bool]:
+    """SET key 1 NX EX ttl。返回 True=佔用成功，False=已存在，None=Redis 不可用。"""
+    result = await _run("set_nx", lambda r: r.set(name=key, value="1", nx=True, ex=ttl), default=_UNAVAILABLE)
+    if result is _UNAVAILABLE:
+        return None
+    return bool(result)
+
+
+async def expire(key: str, ttl: int) -> None:
+    await _run("expire", lambda r: r.expire(key, ttl))
+
+
+async def delete(key: str) -> None:
+    await _run("delete", lambda r: r.delete(key))
+
+
+async def exists_any(*keys: str) -> bool:
+    """任一鍵存在返回 True；Redis 不可用時返回 False。"""
+    result = await _run("exists", lambda r: r.exists(*keys), default=0)
+    return bool(result)
+
+
+async def get_value(key: str) -> Optional[str]:
+    """GET key；不存在或 Redis 不可用時返回 None。"""
+    return await _run("get", lambda r: r.get(key))
+
+
+async def set_value(key: str, value: str, ttl: int) -> None:
+    await _run("set", lambda r: r.set(name=key, value=value, ex=max(1, int(ttl))))
+
+
+async def claim_chat_push(published_key: str, msgid_key: str, chat_key: str, ttl: int) -> Optional[str]:
+    """一次往返完成單個發送目標的冪等檢查（Lua 腳本）。
+
+    返回 'published' / 'claimed' / 'duplicate'；Redis 不可用時返回 None。
+    """
+    async def _claim(r: aioredis.Redis):
+        return await _claim_script(keys=[published_key, msgid_key, chat_key], args=[int(ttl)])
+
+    return await _run("claim_chat_push", _claim)
+
+
+async def mark_published(published_key: str, msgid_key: str, message_id: Optional[Any], ttl: int) -> None:
+    """發送成功後以單個 pipeline 寫入已發布標記與 message_id。"""
+    async def _mark(r: aioredis.Redis):
+        pipe = r.pipeline(transaction=False)
+        pipe.set(name=published_key, value="1", ex=ttl)
+        if message_id is not None:
+            pipe.set(name=msgid_key, value=str(message_id), ex=ttl)
+        return await pipe.execute()
+
+    await _run("mark_published", _mark)
+
+
+def redis_stats() -> Dict[str, Any]:
+    return {
+        "configured": bool(REDIS_HOST),
+        "breaker_state": _breaker.state,
+        "breaker_open_count": _breaker.open_count,
+        "breaker_rejected": _breaker.rejected,
+        **_op_counters,
+    }
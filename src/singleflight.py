@@ -0,0 +1,147 @@
+import os
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 每組保留最近 N 個鍵的合併計數，stats 輸出其中合併最多的前 M 個
+SINGLEFLIGHT_KEY_STATS = int(os.getenv("SINGLEFLIGHT_KEY_STATS", "1000"))
+SINGLEFLIGHT_TOP_KEYS = int(os.getenv("SINGLEFLIGHT_TOP_KEYS", "20"))
+
+_calls_total = registry.counter(
+    "singleflight_calls_total", "上游查詢次數（leader=實際發出請求，follower=合併到進行中的請求）", ["group", "role"]
+)
+_ratio_gauge = registry.gauge("singleflight_coalescing_ratio", "被合併的調用佔比（group=all 為全部合計）", ["group"])
+
+_groups: Dict[str, "SingleFlight"] = {}
+_totals = {"leader": 0, "follower": 0}
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """同一鍵的併發查詢只發出一次上游請求，其餘調用方等待同一結果。
+
+    請求在獨立任務中執行：發起者被取消（如階段超時）不會連帶取消其他等待者。
+    """
+
+    def __init__(self, group: str):
+        self.group = group
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._counts = {"leader": 0, "follower": 0}
+        self._key_counts: "OrderedDict[str, List[int]]" = OrderedDict()
+        _groups[group] = self
+
+    def record(self, key: str, follower: bool) -> None:
+        """記錄一次調用（供自行實現合併的模塊共用統計）。"""
+        role = "follower" if follower else "leader"
+        self._counts[role] += 1
+        _totals[role] += 1
+        _calls_total.inc(group=self.group, role=role)
+        counts = self._key_counts.get(key)
+        if counts is None:
+            counts = self._key_counts[key] = [0, 0]
+            while len(self._key_counts) > SINGLEFLIGHT_KEY_STATS:
+                self._key_counts.popitem(last=False)
+        else:
+            self._key_counts.move_to_end(key)
+        counts[1 if follower else 0] += 1
+        _ratio_gauge.set(self.coalescing_ratio(), group=self.group)
+        _ratio_gauge.set(_ratio(_totals["leader"], _totals["follower"]), group="all")
+
+    def coalescing_ratio(self) -> float:
+        return _ratio(self._counts["leader"], self._counts["follower"])
+
+    def _start(self, key: str, awaitable: Awaitable[Any]) -> asyncio.Future:
+        task = asyncio.ensure_future(awaitable)
+        task.add_done_callback(_consume_result)
+        self._inflight[key] = task
+        task.add_done_callback(lambda _t, k=key: self._release(k, _t))
+        return task
+
+    def _release(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        self.record(key, follower=future is not None)
+        if future is None:
+            future = self._start(key, fn())
+        return await asyncio.shield(future)
+
+    async def do_batch(
+        self, keys: Iterable[str], fetch: Callable[[List[str]], Awaitable[Dict[str, T]]]
+    ) -> Dict[str, T]:
+        """批量版本：已在進行中的鍵等待其結果，其餘鍵合併為一次 fetch；返回值不含結果為 None 的鍵。"""
+        unique = list(dict.fromkeys(keys))
+        joined = {k: self._inflight[k] for k in unique if k in self._inflight}
+        own = [k for k in unique if k not in joined]
+        for k in unique:
+            self.record(k, follower=k in joined)
+
+        batch: Optional[asyncio.Future] = None
+        if own:
+            batch = asyncio.ensure_future(fetch(own))
+            batch.add_done_callback(_consume_result)
+            loop = asyncio.get_running_loop()
+            own_futures: Dict[str, asyncio.Future] = {}
+            for k in own:
+                per_key = own_futures[k] = loop.create_future()
+                per_key.add_done_callback(_consume_result)
+                self._inflight[k] = per_key
+                per_key.add_done_callback(lambda _f, key=k: self._release(key, _f))
+
+            def _distribute(task: asyncio.Future) -> None:
+                for key, per_key in own_futures.items():
+                    if per_key.done():
+                        continue
+                    if task.cancelled():
+                        per_key.cancel()
+                    elif task.exception() is not None:
+                        per_key.set_exception(task.exception())
+                    else:
+                        per_key.set_result((task.result() or {}).get(key))
+
+            batch.add_done_callback(_distribute)
+
+        results: Dict[str, T] = {}
+        if batch is not None:
+            results.update({k: v for k, v in (await asyncio.shield(batch) or {}).items() if v is not None})
+        if joined:
+            values = await asyncio.gather(*(asyncio.shield(f) for f in joined.values()))
+            results.update({k: v for k, v in zip(joined.keys(), values) if v is not None})
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        top = sorted(self._key_counts.items(), key=lambda item: item[1][1], reverse=True)[:SINGLEFLIGHT_TOP_KEYS]
+        return {
+            "inflight": len(self._inflight),
+            **self._counts,
+            "coalescing_ratio": round(self.coalescing_ratio(), 4),
+            "top_keys": [
+                {"key": k, "leader": c[0], "follower": c[1], "coalescing_ratio": round(_ratio(c[0], c[1]), 4)}
+                for k, c in top if c[1] > 0
+            ],
+        }
+
+
+def _ratio(leader: int, follower: int) -> float:
+    total = leader + follower
+    return follower / total if total else 0.0
+
+
+def singleflight_stats() -> Dict[str, Any]:
+    return {
+        "aggregate": {**_totals, "coalescing_ratio": round(_ratio(_totals["leader"], _totals["follower"]), 4)},
+        "groups": {name: group.stats() for name, group in _groups.items()},
+    }
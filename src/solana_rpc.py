@@ -0,0 +1,243 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+from hedging import Hedger
+from enrichment_cache import enrichment_cache
+from singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+load_dotenv(override=True)
+
+RPC_URL = os.getenv("RPC_URL")
+RPC_URL_BACKUP = os.getenv("RPC_URL_backup")
+# 單次 RPC 請求超時（秒）
+SOL_RPC_TIMEOUT = float(os.getenv("SOL_RPC_TIMEOUT", "5"))
+# 節點健康：連續失敗 N 次後標記為不健康，冷卻 M 秒內優先使用其他節點
+SOL_RPC_FAILURE_THRESHOLD = int(os.getenv("SOL_RPC_FAILURE_THRESHOLD", "3"))
+SOL_RPC_UNHEALTHY_SECONDS = float(os.getenv("SOL_RPC_UNHEALTHY_SECONDS", "30"))
+# 餘額查詢合併：窗口內的請求合併為一次 getMultipleAccounts（單次最多 100 個地址）
+SOL_BALANCE_BATCH_WINDOW_MS = float(os.getenv("SOL_BALANCE_BATCH_WINDOW_MS", "20"))
+SOL_BALANCE_BATCH_MAX = max(1, min(100, int(os.getenv("SOL_BALANCE_BATCH_MAX", "100"))))
+
+LAMPORTS_PER_SOL = 10**9
+
+# 餘額服務自行合併同地址請求（待批量的 future），這裡只共用 single-flight 的統計與指標
+_balance_flight = SingleFlight("balance")
+
+
+class RpcEndpoint:
+    """單個 RPC 節點：長連接客戶端 + 健康狀態。"""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.url = url
+        self._client: Optional[AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._failures = 0
+        self._unhealthy_until = 0.0
+        self.stats = {"requests": 0, "failures": 0, "marked_unhealthy": 0}
+
+    def client(self) -> AsyncClient:
+        """取得該節點的共享客戶端；事件循環變更時重新建立。"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = AsyncClient(self.url, timeout=SOL_RPC_TIMEOUT)
+            self._client_loop = loop
+        return self._client
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self._unhealthy_until
+
+    def record_success(self) -> None:
+        if self._failures >= SOL_RPC_FAILURE_THRESHOLD:
+            logger.info(f"Solana RPC 節點恢復: {self.name}")
+        self._failures = 0
+        self._unhealthy_until = 0.0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self.stats["failures"] += 1
+        if self._failures >= SOL_RPC_FAILURE_THRESHOLD:
+            if self.healthy:
+                self.stats["marked_unhealthy"] += 1
+                logger.warning(
+                    f"Solana RPC 節點連續失敗 {self._failures} 次，{SOL_RPC_UNHEALTHY_SECONDS:.0f}s 內降級: {self.name}"
+                )
+            self._unhealthy_until = time.monotonic() + SOL_RPC_UNHEALTHY_SECONDS
+
+    async def close(self) -> None:
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception as e:
+                logger.warning(f"關閉 Solana RPC 客戶端時發生錯誤: {self.name}, err={e}")
+        self._client = None
+        self._client_loop = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"healthy": self.healthy, "consecutive_failures": self._failures, **self.stats}
+
+
+class SolanaRpcPool:
+    """主/備 RPC 節點池：按優先級使用健康節點；全部不健康時仍按順序嘗試。
+
+    首選節點失敗時立即切換到下一個；首選節點慢於其近期 p95 時，在對沖預算內同時請求下一個節點，取先成功者。
+    """
+
+    def __init__(self, endpoints: List[Tuple[str, Optional[str]]]):
+        self._endpoints = [RpcEndpoint(name, url) for name, url in endpoints if url]
+        self._hedger = Hedger("rpc")
+
+    def _ordered(self) -> List[RpcEndpoint]:
+        healthy = [e for e in self._endpoints if e.healthy]
+        return healthy + [e for e in self._endpoints if not e.healthy]
+
+    async def _call_endpoint(self, endpoint: RpcEndpoint, fn: Callable[[AsyncClient], Awaitable[Any]]) -> Any:
+        endpoint.stats["requests"] += 1
+        try:
+            result = await fn(endpoint.client())
+        except asyncio.CancelledError:
+            # 對沖落敗被取消，不計入節點失敗
+            raise
+        except Exception as e:
+            endpoint.record_failure()
+            logger.warning(f"Solana RPC 請求失敗: {endpoint.name}, err={e!r}")
+            raise
+        endpoint.record_success()
+        return result
+
+    async def call(self, fn: Callable[[AsyncClient], Awaitable[Any]]) -> Any:
+        """在首選節點上執行 fn（必要時切換/對沖到次選節點），都失敗時拋出最後一個異常。"""
+        if not self._endpoints:
+            raise RuntimeError("未配置 RPC_URL / RPC_URL_backup")
+        ordered = self._ordered()
+        if len(ordered) == 1:
+            return await self._call_endpoint(ordered[0], fn)
+        primary, backup = ordered[0], ordered[1]
+        return await self._hedger.run(
+            lambda: self._call_endpoint(primary, fn),
+            lambda: self._call_endpoint(backup, fn),
+        )
+
+    async def close(self) -> None:
+        for endpoint in self._endpoints:
+            await endpoint.close()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {e.name: e.snapshot() for e in self._endpoints}
+
+
+class SolBalanceService:
+    """SOL 餘額查詢：短期緩存（enrichment_cache 的 balance 類別，SOL_BALANCE_CACHE_TTL）+ 同地址併發合併 + 窗口內批量 getMultipleAccounts。"""
+
+    def __init__(self, pool: SolanaRpcPool):
+        self._pool = pool
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queue: List[str] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self._stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "batches": 0, "batched_wallets": 0, "failed_batches": 0}
+
+    async def get_balance(self, wallet_address: str) -> float:
+        """返回錢包 SOL 餘額；地址無效或 RPC 全部失敗時返回 0.0（失敗結果不緩存）。"""
+        self._stats["requests"] += 1
+        cached = await enrichment_cache.get("balance", wallet_address)
+        if cached is not None:
+            self._stats["cache_hits"] += 1
+            return cached
+
+        # 緩存查詢（可能經過 Redis）期間同地址的請求可能已入隊，這裡再取一次
+        future = self._pending.get(wallet_address)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            _balance_flight.record(wallet_address, follower=True)
+        else:
+            try:
+                Pubkey.from_string(wallet_address)
+            except Exception as e:
+                logger.error(f"無效的錢包地址，無法查詢 SOL 餘額: {wallet_address}, err={e}")
+                return 0.0
+            _balance_flight.record(wallet_address, follower=False)
+            loop = asyncio.get_running_loop()
+            future = self._pending[wallet_address] = loop.create_future()
+            self._queue.append(wallet_address)
+            if len(self._queue) >= SOL_BALANCE_BATCH_MAX:
+                self._schedule_flush(0)
+            elif self._flush_handle is None:
+                self._schedule_flush(SOL_BALANCE_BATCH_WINDOW_MS / 1000.0)
+        # shield：調用方超時取消時不影響同批其他等待者
+        return await asyncio.shield(future)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._flush_handle = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        while self._queue:
+            wallets = self._queue[:SOL_BALANCE_BATCH_MAX]
+            del self._queue[:SOL_BALANCE_BATCH_MAX]
+            task = asyncio.get_running_loop().create_task(self._fetch_batch(wallets))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_batch(self, wallets: List[str]) -> None:
+        self._stats["batches"] += 1
+        self._stats["batched_wallets"] += len(wallets)
+        balances: Dict[str, float] = {}
+        try:
+            pubkeys = [Pubkey.from_string(w) for w in wallets]
+            response = await self._pool.call(lambda client: client.get_multiple_accounts(pubkeys))
+            for wallet, account in zip(wallets, response.value):
+                # 不存在的賬戶返回 None，餘額視為 0
+                balance = float(account.lamports) / LAMPORTS_PER_SOL if account is not None else 0.0
+                balances[wallet] = balance
+            await asyncio.gather(*(enrichment_cache.put("balance", w, b) for w, b in balances.items()))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats["failed_batches"] += 1
+            logger.error(f"批量獲取 SOL 餘額失敗（{len(wallets)} 個地址）: {e}")
+        finally:
+            for wallet in wallets:
+                future = self._pending.pop(wallet, None)
+                if future is not None and not future.done():
+                    future.set_result(balances.get(wallet, 0.0))
+
+    async def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(0.0)
+        self._pending.clear()
+        self._queue.clear()
+        await self._pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "endpoints": self._pool.stats()}
+
+
+rpc_pool = SolanaRpcPool([("primary", RPC_URL), ("backup", RPC_URL_BACKUP)])
+sol_balances = SolBalanceService(rpc_pool)
+
+
+async def get_sol_balance(wallet_address: str) -> float:
+    """獲取錢包 SOL 餘額（浮點數）。"""
+    return await sol_balances.get_balance(wallet_address)
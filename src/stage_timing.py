@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, Optional, Tuple
+
+from metrics import registry
+from tracing import current_trace
+
+logger = logging.getLogger(__name__)
+
+# 每個階段保留最近 N 次耗時樣本，用於計算分位數
+STAGE_TIMING_SAMPLES = int(os.getenv("STAGE_TIMING_SAMPLES", "500"))
+
+# 與 StageStats 同源的 Prometheus 指標（按上游階段與結果區分）
+_stage_seconds = registry.histogram(
+    "enrichment_stage_seconds", "代幣信息增強各上游階段耗時", ["stage", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20),
+)
+
+
+class StageStats:
+    """記錄各增強階段（ES / Solscan / RPC / 聰明錢 ...）的耗時與結果。"""
+
+    def __init__(self, max_samples: int = STAGE_TIMING_SAMPLES):
+        self._max_samples = max(1, int(max_samples))
+        self._samples: Dict[str, Deque[float]] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+
+    def record(self, stage: str, elapsed: float, outcome: str = "ok") -> None:
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self._max_samples)
+            self._outcomes[stage] = {"ok": 0, "timeout": 0, "error": 0}
+        samples.append(elapsed)
+        outcomes = self._outcomes[stage]
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def percentile(self, stage: str, pct: float) -> Optional[float]:
+        samples = self._samples.get(stage)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+        return ordered[idx]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        result: Dict[str, Dict[str, Any]] = {}
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            n = len(ordered)
+            result[stage] = {
+                "samples": n,
+                "p50_ms": round(ordered[int(0.50 * (n - 1))] * 1000, 1),
+                "p95_ms": round(ordered[int(0.95 * (n - 1))] * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+                **self._outcomes.get(stage, {}),
+            }
+        return result
+
+
+enrichment_stats = StageStats()
+
+
+async def run_stage(
+    stage: str,
+    awaitable: Awaitable[Any],
+    timeout: Optional[float] = None,
+    default: Any = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Tuple[Any, bool]:
+    """在獨立截止時間內執行一個增強階段。
+
+    超時或異常時返回 (default, False)，不拋出，讓調用方以部分結果繼續。
+    timings 若提供，會寫入本次耗時（秒），便於單次請求的耗時日誌；
+    當前上下文有處理時間線（tracing）時同時記錄一段 span。
+    """
+    start = time.monotonic()
+    wall_start = time.time()
+    outcome = "ok"
+    try:
+        if timeout is not None and timeout > 0:
+            result = await asyncio.wait_for(awaitable, timeout=timeout)
+        else:
+            result = await awaitable
+        return result, True
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        logger.warning(f"增強階段超時: stage={stage}, timeout={timeout}s")
+        return default, False
+    except asyncio.CancelledError:
+        outcome = "error"
+        raise
+    except Exception as e:
+        outcome = "error"
+        logger.warning(f"增強階段失敗: stage={stage}, err={e}")
+        return default, False
+    finally:
+        elapsed = time.monotonic() - start
+        enrichment_stats.record(stage, elapsed, outcome)
+        _stage_seconds.observe(elapsed, stage=stage, outcome=outcome)
+        trace = current_trace()
+        if trace is not None:
+            trace.add_span(f"enrich:{stage}", wall_start, wall_start + elapsed, outcome=outcome)
+        if timings is not None:
+            timings[stage] = elapsed
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{stage}={elapsed * 1000:.0f}ms" for stage, elapsed in timings.items())
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LaneQueue:
+    """進程內的多優先級工作隊列。
+
+    - 每條 lane 有獨立的深度上限，滿時 put_nowait 拋出 asyncio.QueueFull
+    - lanes 的順序即優先級：get() 總是先取排在前面的非空 lane
+    - 取出的元素附帶入隊時間（monotonic），便於統計排隊等待
+    """
+
+    def __init__(self, lanes: List[Tuple[str, int]]):
+        self._order: List[str] = [name for name, _ in lanes]
+        self._maxsize: Dict[str, int] = {name: max(0, int(size)) for name, size in lanes}
+        self._lanes: Dict[str, Deque[Tuple[float, Any]]] = {name: deque() for name in self._order}
+        # 以信號量計數隊列中的元素，get() 無元素時掛起而非輪詢
+        self._items = asyncio.Semaphore(0)
+
+    def lanes(self) -> List[str]:
+        return list(self._order)
+
+    def qsize(self, lane: Optional[str] = None) -> int:
+        if lane is not None:
+            return len(self._lanes[lane])
+        return sum(len(q) for q in self._lanes.values())
+
+    def maxsize(self, lane: str) -> int:
+        return self._maxsize[lane]
+
+    def full(self, lane: str) -> bool:
+        limit = self._maxsize[lane]
+        return limit > 0 and len(self._lanes[lane]) >= limit
+
+    def put_nowait(self, lane: str, item: Any) -> None:
+        if lane not in self._lanes:
+            raise KeyError(f"unknown lane: {lane}")
+        if self.full(lane):
+            raise asyncio.QueueFull
+        self._lanes[lane].append((time.monotonic(), item))
+        self._items.release()
+
+    async def get(self) -> Tuple[str, Any, float]:
+        """返回 (lane, item, enqueued_at)。"""
+        await self._items.acquire()
+        for lane in self._order:
+            q = self._lanes[lane]
+            if q:
+                enqueued_at, item = q.popleft()
+                return lane, item, enqueued_at
+        # 理論上不會發生：計數與內容不一致時歸還許可並重試
+        self._items.release()
+        return await self.get()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            lane: {"size": len(self._lanes[lane]), "maxsize": self._maxsize[lane]}
+            for lane in self._order
+        }
+
+
+class WorkerPool:
+    """固定數量的 worker 協程，並發消費 LaneQueue。"""
+
+    def __init__(
+        self,
+        queue: LaneQueue,
+        handler: Callable[[str, Any, float], Awaitable[None]],
+        concurrency: int,
+        name: str = "worker",
+    ):
+        self._queue = queue
+        self._handler = handler
+        self._concurrency = max(1, int(concurrency))
+        self._name = name
+        self._tasks: List[asyncio.Task] = []
+        self._busy = 0
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def busy(self) -> int:
+        return self._busy
+
+    def start(self) -> List[asyncio.Task]:
+        if self._tasks:
+            return self._tasks
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._run(i), name=f"{self._name}-{i}")
+            for i in range(self._concurrency)
+        ]
+        logger.info(f"{self._name} 已啟動 {self._concurrency} 個並發 worker")
+        return self._tasks
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self, worker_id: int) -> None:
+        try:
+            while True:
+                lane, item, enqueued_at = await self._queue.get()
+                self._busy += 1
+                try:
+                    await self._handler(lane, item, enqueued_at)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"{self._name}-{worker_id} 處理任務時發生錯誤: {e}")
+                finally:
+                    self._busy -= 1
+        except asyncio.CancelledError:
+            logger.info(f"{self._name}-{worker_id} 已取消")
+            raise
@@ -0,0 +1,84 @@
+import os
+import asyncio
+import logging
+from typing import Optional
+
+from dotenv import load_dotenv
+from telegram import Bot
+from telegram.request import HTTPXRequest
+
+logger = logging.getLogger(__name__)
+
+load_dotenv(override=True)
+
+BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+
+# 推送用 HTTP 連接池配置：連接數需覆蓋一次扇出（語言主題 + 額外頻道）的寬度
+TELEGRAM_POOL_SIZE = int(os.getenv("TELEGRAM_POOL_SIZE", "64"))
+# HTTP/2 可在單一連接上多路復用；設為 1.1 則退回 keep-alive 連接池
+TELEGRAM_HTTP_VERSION = os.getenv("TELEGRAM_HTTP_VERSION", "2")
+TELEGRAM_CONNECT_TIMEOUT = float(os.getenv("TELEGRAM_CONNECT_TIMEOUT", "5"))
+TELEGRAM_READ_TIMEOUT = float(os.getenv("TELEGRAM_READ_TIMEOUT", "10"))
+TELEGRAM_WRITE_TIMEOUT = float(os.getenv("TELEGRAM_WRITE_TIMEOUT", "10"))
+# 等待空閒連接的時間；扇出瞬間請求數可能超過連接數，不宜過短
+TELEGRAM_POOL_TIMEOUT = float(os.getenv("TELEGRAM_POOL_TIMEOUT", "10"))
+
+_bot: Optional[Bot] = None
+_bot_loop: Optional[asyncio.AbstractEventLoop] = None
+_bot_lock: Optional[asyncio.Lock] = None
+
+
+def _build_request() -> HTTPXRequest:
+    http_version = TELEGRAM_HTTP_VERSION
+    if http_version.startswith("2"):
+        try:
+            import h2  # noqa: F401  httpx 的 HTTP/2 支持依賴 h2
+        except ImportError:
+            logger.warning("未安裝 h2，Telegram 推送改用 HTTP/1.1 keep-alive")
+            http_version = "1.1"
+    return HTTPXRequest(
+        connection_pool_size=TELEGRAM_POOL_SIZE,
+        connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+        read_timeout=TELEGRAM_READ_TIMEOUT,
+        write_timeout=TELEGRAM_WRITE_TIMEOUT,
+        pool_timeout=TELEGRAM_POOL_TIMEOUT,
+        http_version=http_version,
+    )
+
+
+async def get_bot() -> Bot:
+    """取得進程內共享的推送 Bot（首次調用時建立並初始化）。
+
+    Bot 與其 HTTP 連接池綁定到建立它的事件循環；若循環已變更會重新建立。
+    """
+    global _bot, _bot_loop, _bot_lock
+    loop = asyncio.get_running_loop()
+    if _bot is not None and _bot_loop is loop:
+        return _bot
+    if _bot_lock is None or _bot_loop is not loop:
+        _bot_lock = asyncio.Lock()
+        _bot_loop = loop
+        _bot = None
+    async with _bot_lock:
+        if _bot is None:
+            bot = Bot(token=BOT_TOKEN, request=_build_request())
+            await bot.initialize()
+            _bot = bot
+            logger.info(
+                f"共享 Telegram Bot 已建立: pool_size={TELEGRAM_POOL_SIZE}, http_version={TELEGRAM_HTTP_VERSION}"
+            )
+    return _bot
+
+
+async def close_bot() -> None:
+    """關閉共享 Bot 的連接池（應在進程退出前調用）。"""
+    global _bot, _bot_loop, _bot_lock
+    if _bot is not None:
+        try:
+            await _bot.shutdown()
+            logger.info("共享 Telegram Bot 已關閉")
+        except Exception as e:
+            logger.warning(f"關閉共享 Telegram Bot 時發生錯誤: {e}")
+    _bot = None
+    _bot_loop = None
+    _bot_lock = None
@@ -0,0 +1,190 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv(override=True)
+
+# Telegram 官方限制：全局約 30 msg/s；同一 chat 約 1 msg/s；同一群組約 20 msg/min
+TG_GLOBAL_RATE_PER_SEC = float(os.getenv("TG_GLOBAL_RATE_PER_SEC", "30"))
+TG_GLOBAL_BURST = int(os.getenv("TG_GLOBAL_BURST", "30"))
+TG_CHAT_RATE_PER_SEC = float(os.getenv("TG_CHAT_RATE_PER_SEC", "1"))
+TG_CHAT_BURST = int(os.getenv("TG_CHAT_BURST", "1"))
+TG_GROUP_RATE_PER_MIN = float(os.getenv("TG_GROUP_RATE_PER_MIN", "20"))
+TG_GROUP_BURST = int(os.getenv("TG_GROUP_BURST", "20"))
+# 排程等待超過此值時記錄警告（秒）
+TG_SLOW_SLOT_WARN_SECONDS = float(os.getenv("TG_SLOW_SLOT_WARN_SECONDS", "10"))
+# 閒置多久的 chat 桶會被清理（秒）
+TG_BUCKET_IDLE_SECONDS = float(os.getenv("TG_BUCKET_IDLE_SECONDS", "300"))
+
+
+class TokenBucket:
+    """以 GCRA（虛擬排程）實現的令牌桶。
+
+    reserve() 不會拒絕請求，而是直接預約下一個可用時間點；
+    多個並發發送因此被預先錯開，而不是同時衝出後再被 429。
+    """
+
+    __slots__ = ("_interval", "_tolerance", "_tat", "_last_slot")
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        self._interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._tolerance = self._interval * max(0, int(burst) - 1)
+        self._tat = 0.0  # theoretical arrival time
+        self._last_slot: Optional[float] = None
+
+    def reserve(self, now: float) -> float:
+        """預約一個令牌，返回可發送的時間點（monotonic）。"""
+        if self._interval <= 0:
+            return now
+        slot = max(now, self._tat - self._tolerance)
+        self._tat = max(self._tat, slot) + self._interval
+        self._last_slot = slot
+        return slot
+
+    def block_until(self, until: float) -> None:
+        """限流懲罰：在 until 之前不再發放令牌。"""
+        if self._interval <= 0:
+            return
+        self._tat = max(self._tat, until + self._tolerance)
+        self._last_slot = None
+
+    def release(self, slot: float) -> None:
+        """歸還未使用的預約；僅當它仍是最後一個預約時回退，避免與之後的預約重疊。"""
+        if self._interval > 0 and self._last_slot == slot:
+            self._tat -= self._interval
+            self._last_slot = None
+
+    def idle_since(self, now: float) -> float:
+        return now - self._tat
+
+
+class TelegramRateLimiter:
+    """進程內的 Telegram 發送排程器：全局桶 + 每 chat 桶 + 每群組（分鐘級）桶。"""
+
+    def __init__(self):
+        self._global = TokenBucket(TG_GLOBAL_RATE_PER_SEC, TG_GLOBAL_BURST)
+        self._chats: Dict[str, TokenBucket] = {}
+        self._groups: Dict[str, TokenBucket] = {}
+        self._cooldown_until: Dict[str, float] = {}
+        self._stats: Dict[str, float] = {
+            "acquired": 0,
+            "delayed": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "retry_after_events": 0,
+        }
+        self._reserve_calls = 0
+
+    @staticmethod
+    def _is_group(chat_id: str) -> bool:
+        # 群組/頻道的 chat_id 為負數（-100 前綴為超級群組/頻道）
+        return chat_id.startswith("-")
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = self._chats[chat_id] = TokenBucket(TG_CHAT_RATE_PER_SEC, TG_CHAT_BURST)
+        return bucket
+
+    def _group_bucket(self, chat_id: str) -> Optional[TokenBucket]:
+        if not self._is_group(chat_id):
+            return None
+        bucket = self._groups.get(chat_id)
+        if bucket is None:
+            bucket = self._groups[chat_id] = TokenBucket(TG_GROUP_RATE_PER_MIN / 60.0, TG_GROUP_BURST)
+        return bucket
+
+    def _reserve_chat(self, chat_id: str, now: float) -> Tuple[float, Optional[float]]:
+        """按 chat 限制（含 RetryAfter 冷卻）與群組分鐘限額預約，返回 (chat 預約, 群組預約)。"""
+        ready = max(now, self._cooldown_until.get(chat_id, 0.0))
+        chat_slot = self._chat_bucket(chat_id).reserve(ready)
+        group_slot = None
+        group_bucket = self._group_bucket(chat_id)
+        if group_bucket is not None:
+            group_slot = group_bucket.reserve(chat_slot)
+
+        self._reserve_calls += 1
+        if self._reserve_calls % 1000 == 0:
+            self._prune(now)
+        return chat_slot, group_slot
+
+    def _release(self, chat_id: str, chat_slot: float, group_slot: Optional[float], global_slot: Optional[float]) -> None:
+        self._chat_bucket(chat_id).release(chat_slot)
+        group_bucket = self._group_bucket(chat_id)
+        if group_bucket is not None and group_slot is not None:
+            group_bucket.release(group_slot)
+        if global_slot is not None:
+            self._global.release(global_slot)
+
+    def _prune(self, now: float) -> None:
+        for buckets in (self._chats, self._groups):
+            stale = [cid for cid, b in buckets.items() if b.idle_since(now) > TG_BUCKET_IDLE_SECONDS]
+            for cid in stale:
+                buckets.pop(cid, None)
+        expired = [cid for cid, until in self._cooldown_until.items() if until < now]
+        for cid in expired:
+            self._cooldown_until.pop(cid, None)
+
+    async def acquire(self, chat_id: Any) -> float:
+        """等待直到可以向 chat_id 發送下一條消息，返回實際等待秒數。"""
+        chat_key = str(chat_id)
+        start = time.monotonic()
+        chat_slot, group_slot = self._reserve_chat(chat_key, start)
+        global_slot: Optional[float] = None
+        try:
+            while True:
+                delay = max(chat_slot, group_slot or chat_slot) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                cooldown_until = self._cooldown_until.get(chat_key, 0.0)
+                if cooldown_until <= time.monotonic():
+                    break
+                # 等待期間該 chat 收到 RetryAfter：只在冷卻結束後重新預約 chat 桶，保留已佔用的群組額度
+                chat_slot = self._chat_bucket(chat_key).reserve(max(chat_slot, cooldown_until))
+
+            # chat 就緒後才預約全局令牌，避免遠期的 chat 預約佔住全局額度
+            now = time.monotonic()
+            global_slot = self._global.reserve(now)
+            delay = global_slot - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # 取消的發送歸還預約，避免空佔 chat/群組/全局額度
+            self._release(chat_key, chat_slot, group_slot, global_slot)
+            raise
+
+        waited = time.monotonic() - start
+        self._stats["acquired"] += 1
+        if waited > 0.001:
+            self._stats["delayed"] += 1
+            self._stats["total_wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        if waited > TG_SLOW_SLOT_WARN_SECONDS:
+            logger.warning(f"Telegram 發送排程等待過久: chat={chat_key}, waited={waited:.1f}s")
+        return waited
+
+    def penalize(self, chat_id: Any, retry_after: float) -> None:
+        """收到 RetryAfter 時，對整個 chat 生效（而非僅當前協程）。"""
+        chat_key = str(chat_id)
+        until = time.monotonic() + max(0.0, float(retry_after))
+        self._cooldown_until[chat_key] = max(self._cooldown_until.get(chat_key, 0.0), until)
+        self._chat_bucket(chat_key).block_until(until)
+        self._stats["retry_after_events"] += 1
+        logger.warning(f"Telegram 限流: chat={chat_key} 冷卻 {retry_after}s")
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            **{k: (round(v, 3) if isinstance(v, float) else v) for k, v in self._stats.items()},
+            "tracked_chats": len(self._chats),
+            "cooling_chats": sum(1 for until in self._cooldown_until.values() if until > now),
+        }
+
+
+telegram_rate_limiter = TelegramRateLimiter()
@@ -0,0 +1,177 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+UTC8 = timezone(timedelta(hours=8))
+
+DEV_STATUS_DISPLAY = {0: "DEV持有", 1: "DEV减仓", 2: "DEV加仓", 3: "DEV清仓", 4: "DEV加池子", 5: "DEV烧池子"}
+
+# 合約安全項（推送消息與 crypto_info.contract_security 使用的四類）
+SECURITY_CATEGORIES = ("authority", "rug_pull", "burn_pool", "blacklist")
+
+
+# ------------------------------------------------顯示格式化------------------------------------------------
+
+def _strip_zeros(text: str) -> str:
+    text = text.rstrip('0').rstrip('.')
+    return text[:-1] if text.endswith('.') else text
+
+
+def format_market_cap(market_cap: Optional[float]) -> str:
+    """市值顯示，使用 K、M、B 表示。"""
+    if market_cap is None:
+        return "--"
+    if market_cap >= 1_000_000_000:
+        return _strip_zeros(f"$ {market_cap / 1_000_000_000:.2f}B")
+    if market_cap >= 1_000_000:
+        return _strip_zeros(f"$ {market_cap / 1_000_000:.2f}M")
+    if market_cap >= 10_000:
+        return _strip_zeros(f"$ {market_cap / 1_000:.2f}K")
+    return _strip_zeros(f"$ {market_cap:,.2f}")
+
+
+def format_price(price: Optional[float]) -> str:
+    """價格顯示，避免科學計數法。"""
+    if price is None:
+        return "--"
+    if price < 0.0001:
+        decimal_places = 8
+        str_price = str(price)
+        # 科學計數法：按指數設置足夠的小數位，多顯示一兩位有效數字
+        if "e-" in str_price:
+            decimal_places = int(str_price.split("e-")[1]) + 2
+        display = f"{price:.{decimal_places}f}".rstrip('0').rstrip('.')
+    else:
+        display = f"{price:.6f}".rstrip('0').rstrip('.')
+    return display or "0"
+
+
+def format_sol_balance(balance: float) -> str:
+    """開發者錢包餘額；小數點後超過 3 個連續 0 時顯示為 整數.0{零的數量}非零部分。"""
+    if not balance:
+        return "0"
+    str_balance = str(balance)
+    if '.' not in str_balance:
+        return f"{balance:.2f}"
+    integer_part, decimal_part = str_balance.split('.')
+    zero_count = len(decimal_part) - len(decimal_part.lstrip('0'))
+    if zero_count <= 3:
+        return f"{balance:.2f}"
+    if zero_count == len(decimal_part):
+        return f"{integer_part}.0"
+    return f"{integer_part}.0{{{zero_count}}}{decimal_part[zero_count:]}"
+
+
+def format_launch_time(launch_ts: Optional[int]) -> Tuple[str, Optional[datetime]]:
+    """返回 (UTC+8 顯示時間, 數據庫存儲用的無時區時間)。"""
+    if not launch_ts:
+        return "--", None
+    try:
+        dt_utc8 = datetime.fromtimestamp(launch_ts, tz=timezone.utc).astimezone(UTC8)
+    except (OverflowError, OSError, ValueError):
+        return "--", None
+    return dt_utc8.strftime("%Y.%m.%d %H:%M:%S"), dt_utc8.replace(tzinfo=None)
+
+
+# ------------------------------------------------代幣快照------------------------------------------------
+
+@dataclass(slots=True)
+class TokenSnapshot:
+    """一個代幣在增強、入庫、格式化與推送之間傳遞的數據。
+
+    只保存類型化的原始值；顯示字串與入庫用的 JSON 在首次訪問時計算並緩存，
+    同一代幣扇出到多個語言/頻道時只計算一次。創建後請勿修改原始值。
+    """
+    token_address: str
+    token_name: str = "Unknown"
+    token_symbol: str = "Unknown"
+    chain: str = "Solana"
+    price: Optional[float] = None
+    market_cap: Optional[float] = None
+    holders: Optional[int] = None
+    # 開盤時間（unix 秒）
+    launch_ts: Optional[int] = None
+    top10_holding: Optional[float] = None
+    dev_status: Optional[int] = None
+    dev_wallet_balance: float = 0.0
+    dev_holding_at_launch: Optional[float] = None
+    dev_holding_current: Optional[float] = None
+    total_addr_amount: int = 0
+    smart_money_activity: Optional[str] = None
+    # 合約安全項：類別 -> 是否通過（見 SECURITY_CATEGORIES）
+    security: Dict[str, bool] = field(default_factory=dict)
+    twitter_url: Optional[str] = None
+    website_url: Optional[str] = None
+    telegram: bool = False
+    highlight_tag_codes: List[int] = field(default_factory=list)
+    # 入庫後的 crypto_info.id 與 premium 附加信息
+    id: Optional[int] = None
+    market_cap_level: Optional[int] = None
+    open_time: Optional[int] = None
+    _cache: Dict[str, object] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _cached(self, key: str, compute: Callable[[], object]):
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = compute()
+        return value
+
+    @property
+    def contract_address(self) -> str:
+        return self.token_address
+
+    @property
+    def market_cap_display(self) -> str:
+        return self._cached("market_cap_display", lambda: format_market_cap(self.market_cap))
+
+    @property
+    def price_display(self) -> str:
+        return self._cached("price_display", lambda: format_price(self.price))
+
+    @property
+    def holders_display(self) -> str:
+        return self._cached("holders_display", lambda: f"{self.holders:,}" if self.holders is not None else "--")
+
+    @property
+    def launch_time_display(self) -> str:
+        return self._cached("launch_time", lambda: format_launch_time(self.launch_ts))[0]
+
+    @property
+    def launch_time(self) -> Optional[datetime]:
+        """UTC+8 無時區時間（數據庫存儲用）。"""
+        return self._cached("launch_time", lambda: format_launch_time(self.launch_ts))[1]
+
+    @property
+    def top10_holding_display(self) -> str:
+        return self._cached(
+            "top10_holding_display", lambda: f"{self.top10_holding:.2f}" if self.top10_holding is not None else "--"
+        )
+
+    @property
+    def dev_status_display(self) -> str:
+        return DEV_STATUS_DISPLAY.get(self.dev_status, "--")
+
+    @property
+    def dev_wallet_balance_display(self) -> str:
+        return self._cached("dev_wallet_balance_display", lambda: format_sol_balance(self.dev_wallet_balance))
+
+    @property
+    def contract_security_json(self) -> str:
+        """入庫用 JSON（crypto_info.contract_security）。"""
+        return self._cached(
+            "contract_security_json",
+            lambda: json.dumps({key: self.security[key] for key in SECURITY_CATEGORIES if key in self.security}),
+        )
+
+    @property
+    def socials_json(self) -> str:
+        """入庫用 JSON（crypto_info.socials）。"""
+        return self._cached("socials_json", lambda: json.dumps({
+            "twitter": self.twitter_url is not None,
+            "website": self.website_url is not None,
+            "telegram": self.telegram,
+            "twitter_search": True,  # 總是可以搜索 Twitter
+            "twitter_url": self.twitter_url,
+            "website_url": self.website_url,
+        }))
@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 進程內保留最近 N 條代幣處理時間線，供 /api/traces 查詢
+TRACE_MAX_TRACES = int(os.getenv("TRACE_MAX_TRACES", "1000"))
+# 完成時輸出一行 JSON 結構化日誌；TRACE_LOG_MIN_MS 以上的時間線才輸出（0=全部）
+TRACE_LOG_ENABLED = os.getenv("TRACE_LOG_ENABLED", "true").lower() == "true"
+TRACE_LOG_MIN_MS = float(os.getenv("TRACE_LOG_MIN_MS", "0"))
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class Span:
+    """時間線上的一段（start == end 時為時間點標記）；時間為 wall clock 秒。"""
+
+    __slots__ = ("name", "start", "end", "attrs")
+
+    def __init__(self, name: str, start: float, end: Optional[float] = None, attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.attrs = attrs or {}
+
+
+class Trace:
+    """單個代幣從事件到 Telegram 推送的處理時間線。
+
+    由 contextvars 在同一任務（及其 gather 出的子任務）內傳遞，各階段只需調用 span()/mark()。
+    """
+
+    def __init__(self, trace_id: str, token_address: str, chain: str = "", origin_ts: Optional[float] = None):
+        self.trace_id = trace_id
+        self.token_address = token_address
+        self.chain = chain
+        self.started_at = time.time()
+        # 時間線起點：上游事件時間（若有），否則為建立時間
+        self.origin_ts = origin_ts or self.started_at
+        self.finished_at: Optional[float] = None
+        self.outcome: Optional[str] = None
+        self.attrs: Dict[str, Any] = {}
+        self.spans: List[Span] = []
+
+    def mark(self, name: str, ts: Optional[float] = None, **attrs: Any) -> None:
+        ts = ts if ts is not None else time.time()
+        self.spans.append(Span(name, ts, ts, attrs))
+
+    def add_span(self, name: str, start: float, end: float, **attrs: Any) -> None:
+        self.spans.append(Span(name, start, end, attrs))
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        item = Span(name, time.time(), None, attrs)
+        self.spans.append(item)
+        try:
+            yield item
+        except BaseException as e:
+            item.attrs.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            item.end = time.time()
+
+    @property
+    def total_seconds(self) -> float:
+        return (self.finished_at or time.time()) - self.origin_ts
+
+    def to_dict(self) -> Dict[str, Any]:
+        spans = []
+        for item in sorted(self.spans, key=lambda s: s.start):
+            entry: Dict[str, Any] = {
+                "name": item.name,
+                "offset_ms": round((item.start - self.origin_ts) * 1000, 1),
+            }
+            if item.end is None:
+                entry["duration_ms"] = None
+            elif item.end > item.start:
+                entry["duration_ms"] = round((item.end - item.start) * 1000, 1)
+            if item.attrs:
+                entry["attrs"] = item.attrs
+            spans.append(entry)
+        return {
+            "trace_id": self.trace_id,
+            "token_address": self.token_address,
+            "chain": self.chain,
+            "outcome": self.outcome,
+            "origin_ts": self.origin_ts,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total_ms": round(self.total_seconds * 1000, 1),
+            "attrs": self.attrs,
+            "spans": spans,
+        }
+
+
+class TraceStore:
+    """保留最近的時間線（按建立順序淘汰最舊的）。"""
+
+    def __init__(self, max_traces: int = TRACE_MAX_TRACES):
+        self._max_traces = max(1, int(max_traces))
+        self._traces: "OrderedDict[str, Trace]" = OrderedDict()
+        self._stats = {"started": 0, "finished": 0, "evicted": 0}
+
+    def add(self, trace: Trace) -> None:
+        self._traces[trace.trace_id] = trace
+        self._traces.move_to_end(trace.trace_id)
+        self._stats["started"] += 1
+        while len(self._traces) > self._max_traces:
+            self._traces.popitem(last=False)
+            self._stats["evicted"] += 1
+
+    def record_finished(self) -> None:
+        self._stats["finished"] += 1
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        return self._traces.get(trace_id)
+
+    def query(self, token_address: Optional[str] = None, limit: int = 50, slowest: bool = False) -> List[Trace]:
+        traces = [t for t in self._traces.values() if not token_address or t.token_address == token_address]
+        if slowest:
+            traces = sorted((t for t in traces if t.finished_at is not None), key=lambda t: t.total_seconds, reverse=True)
+        else:
+            traces.reverse()
+        return traces[:max(1, int(limit))]
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._traces), "max_traces": self._max_traces, **self._stats}
+
+
+trace_store = TraceStore()
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+def start_trace(token_address: str, chain: str = "", trace_id: Optional[str] = None, event_ts: Optional[int] = None) -> Trace:
+    """建立並登記一條時間線；event_ts 為上游事件時間（毫秒），作為時間線起點。"""
+    origin_ts = event_ts / 1000.0 if event_ts else None
+    trace = Trace(trace_id or new_trace_id(), token_address, chain, origin_ts)
+    if origin_ts is not None:
+        trace.mark("event", ts=origin_ts)
+    trace_store.add(trace)
+    return trace
+
+
+def finish_trace(trace: Trace, outcome: Optional[str] = None) -> None:
+    if trace.finished_at is not None:
+        return
+    trace.finished_at = time.time()
+    if outcome is not None or trace.outcome is None:
+        trace.outcome = outcome or "ok"
+    trace_store.record_finished()
+    if TRACE_LOG_ENABLED and trace.total_seconds * 1000 >= TRACE_LOG_MIN_MS:
+        logger.info(f"trace {json.dumps(trace.to_dict(), ensure_ascii=False, default=str)}")
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def use_trace(trace: Optional[Trace]) -> Iterator[Optional[Trace]]:
+    """把 trace 設為當前上下文的時間線（之後創建的子任務會繼承）。"""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """在當前時間線上記錄一段耗時；沒有當前時間線時不做任何事。"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    with trace.span(name, **attrs) as item:
+        yield item
+
+
+def mark(name: str, **attrs: Any) -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.mark(name, **attrs)
+
+
+def set_outcome(outcome: str, **attrs: Any) -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.outcome = outcome
+        trace.attrs.update(attrs)
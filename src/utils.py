@@ -1,9 +1,12 @@
 import os
 import json
+import time
+import asyncio
+import hashlib
 import logging
-import aiohttp
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
+from http_client import get_http_session, timeout_for
 
 # 設置日誌
 logger = logging.getLogger(__name__)
@@ -13,70 +16,252 @@ load_dotenv(override=True)
 
 # 從環境變量加載配置
 SOCIALS_API_URL = os.getenv("SOCIALS_API_URL", "http://127.0.0.1:5002/admin/telegram/social/socials")
+# 額外頻道列表緩存：TTL 內直接使用；過期後先返回舊列表並在後台刷新（stale-while-revalidate）
+CHANNEL_DIRECTORY_TTL_SECONDS = float(os.getenv("CHANNEL_DIRECTORY_TTL_SECONDS", "60"))
+# 超過此時長的舊列表不再直接返回，改為同步等待刷新（刷新失敗仍返回最後一次成功的列表）
+CHANNEL_DIRECTORY_MAX_STALE_SECONDS = float(os.getenv("CHANNEL_DIRECTORY_MAX_STALE_SECONDS", "3600"))
+# 刷新失敗後的重試間隔，避免社交 API 故障時每次推送都去請求
+CHANNEL_DIRECTORY_RETRY_SECONDS = float(os.getenv("CHANNEL_DIRECTORY_RETRY_SECONDS", "10"))
+# 後台定時刷新間隔（秒），0 表示只在讀取時按需刷新
+CHANNEL_DIRECTORY_REFRESH_INTERVAL = float(os.getenv("CHANNEL_DIRECTORY_REFRESH_INTERVAL", str(CHANNEL_DIRECTORY_TTL_SECONDS)))
+
+
+def _empty_channels() -> Dict[str, List[Dict[str, str]]]:
+    return {"high_freq": [], "low_freq": []}
+
+
+def parse_additional_channels(data: Dict[str, Any]) -> Dict[str, List[Dict[str, str]]]:
+    """將社交 API 的返回數據解析為高頻/低頻額外頻道列表"""
+    high_freq_channels = []
+    low_freq_channels = []
+
+    # 遍歷所有用戶的聊天組
+    for user_data in data.get("data", []):
+        social_group = user_data.get("socialGroup")
+        # 語言標準化：如 es_ES -> es；為空或 None 時使用 en
+        raw_lang = user_data.get("lang")
+        language = "en"
+        if raw_lang:
+            try:
+                language_part = str(raw_lang).split("_")[0].lower()
+                if language_part:
+                    language = language_part
+            except Exception:
+                language = "en"
+        if not social_group:
+            continue
+
+        for chat in user_data.get("chats", []):
+            if not chat.get("enable", False):
+                continue
+
+            chat_name = chat.get("name", "")
+            chat_id = chat.get("chatId")
+
+            if "WEB3 Signal - High Freq" in chat_name:
+                high_freq_channels.append({
+                    "group_id": social_group,
+                    "topic_id": chat_id,
+                    "language": language
+                })
+            elif "WEB3 Signal – Low Freq" in chat_name:
+                low_freq_channels.append({
+                    "group_id": social_group,
+                    "topic_id": chat_id,
+                    "language": language
+                })
+
+    return {
+        "high_freq": high_freq_channels,
+        "low_freq": low_freq_channels
+    }
+
+
+class ChannelDirectory:
+    """額外頻道列表的進程內緩存。
+
+    - TTL 內直接返回緩存，不發任何請求；
+    - 過期後立即返回舊列表，同時在後台刷新（同一時間只有一個刷新請求）；
+    - 以 ETag / 響應體 sha256 判斷內容是否變化，未變化時不重新解析；
+    - 社交 API 故障時返回最後一次成功獲取的列表。
+    """
+
+    def __init__(
+        self,
+        ttl: float = CHANNEL_DIRECTORY_TTL_SECONDS,
+        max_stale: float = CHANNEL_DIRECTORY_MAX_STALE_SECONDS,
+        retry_seconds: float = CHANNEL_DIRECTORY_RETRY_SECONDS,
+    ):
+        self._ttl = max(0.0, float(ttl))
+        self._max_stale = max(self._ttl, float(max_stale))
+        self._retry_seconds = max(0.0, float(retry_seconds))
+        self._channels: Optional[Dict[str, List[Dict[str, str]]]] = None
+        self._fetched_at = 0.0
+        self._last_failure_at = 0.0
+        self._etag: Optional[str] = None
+        self._digest: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "blocking_fetches": 0,
+            "refreshes": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "rebuilt": 0,
+            "failures": 0,
+            "served_last_good": 0,
+        }
+
+    def _age(self) -> float:
+        return time.monotonic() - self._fetched_at
+
+    def _in_retry_backoff(self) -> bool:
+        return self._last_failure_at > 0 and time.monotonic() - self._last_failure_at < self._retry_seconds
+
+    async def get(self) -> Dict[str, List[Dict[str, str]]]:
+        """返回額外頻道列表（只讀，調用方請勿修改）。"""
+        if self._channels is not None:
+            age = self._age()
+            if age < self._ttl:
+                self._stats["hits"] += 1
+                return self._channels
+            if age < self._max_stale or self._in_retry_backoff():
+                self._stats["stale_hits"] += 1
+                if not self._in_retry_backoff():
+                    self._ensure_refresh()
+                return self._channels
+        elif self._in_retry_backoff():
+            return _empty_channels()
+
+        # 無緩存或緩存過舊：同步等待刷新
+        self._stats["blocking_fetches"] += 1
+        await asyncio.shield(self._ensure_refresh())
+        if self._channels is None:
+            return _empty_channels()
+        return self._channels
+
+    def _ensure_refresh(self) -> asyncio.Task:
+        """啟動（或復用進行中的）刷新任務，保證同一時間只有一個請求。"""
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+        return task
+
+    async def refresh(self) -> bool:
+        """從社交 API 拉取頻道列表，成功（含未變化）返回 True，失敗保留舊列表並返回 False。"""
+        self._stats["refreshes"] += 1
+        headers = {"If-None-Match": self._etag} if self._etag and self._channels is not None else None
+        try:
+            session = get_http_session()
+            async with session.post(SOCIALS_API_URL, headers=headers, timeout=timeout_for("socials")) as response:
+                if response.status == 304 and self._channels is not None:
+                    self._stats["not_modified"] += 1
+                    self._mark_fresh()
+                    return True
+                if response.status != 200:
+                    return self._mark_failed(f"獲取額外頻道信息失敗: {response.status}")
+
+                body = await response.read()
+                etag = response.headers.get("ETag")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return self._mark_failed(f"獲取額外頻道信息時發生錯誤: {e}")
+
+        digest = hashlib.sha256(body).hexdigest()
+        if digest == self._digest and self._channels is not None:
+            # 內容未變化，跳過解析
+            self._stats["unchanged"] += 1
+            self._etag = etag
+            self._mark_fresh()
+            return True
+
+        try:
+            data = json.loads(body)
+            if data.get("code") != 200:
+                return self._mark_failed("API返回錯誤狀態碼")
+            channels = parse_additional_channels(data)
+        except Exception as e:
+            return self._mark_failed(f"解析額外頻道信息時發生錯誤: {e}")
+
+        self._channels = channels
+        self._digest = digest
+        self._etag = etag
+        self._stats["rebuilt"] += 1
+        self._mark_fresh()
+        logger.info(
+            f"額外頻道列表已更新: high={len(channels['high_freq'])}, low={len(channels['low_freq'])}"
+        )
+        return True
+
+    def _mark_fresh(self) -> None:
+        self._fetched_at = time.monotonic()
+        self._last_failure_at = 0.0
+
+    def _mark_failed(self, message: str) -> bool:
+        self._stats["failures"] += 1
+        self._last_failure_at = time.monotonic()
+        if self._channels is not None:
+            self._stats["served_last_good"] += 1
+            logger.warning(f"{message}，繼續使用最後一次成功的頻道列表（{self._age():.0f}s 前）")
+        else:
+            logger.error(message)
+        return False
+
+    def start(self, interval: float = CHANNEL_DIRECTORY_REFRESH_INTERVAL) -> None:
+        """啟動後台定時刷新，使推送路徑上的讀取始終命中緩存。"""
+        if interval <= 0:
+            return
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.get_running_loop().create_task(self._run(interval))
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self._ensure_refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"額外頻道後台刷新異常: {e}")
+            await asyncio.sleep(interval)
+
+    async def close(self) -> None:
+        for task in (self._loop_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._loop_task = None
+        self._refresh_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        channels = self._channels or {}
+        return {
+            **self._stats,
+            "cached": self._channels is not None,
+            "age_seconds": round(self._age(), 1) if self._channels is not None else None,
+            "high_freq": len(channels.get("high_freq", [])),
+            "low_freq": len(channels.get("low_freq", [])),
+        }
+
+
+channel_directory = ChannelDirectory()
+
 
 async def get_additional_channels() -> Dict[str, List[Dict[str, str]]]:
     """
-    從社交API獲取額外的頻道信息
+    從社交API獲取額外的頻道信息（經由 channel_directory 緩存）
     返回格式: {
         "high_freq": [{"group_id": "xxx", "topic_id": "xxx", "language": "en"}, ...],
         "low_freq": [{"group_id": "xxx", "topic_id": "xxx", "language": "en"}, ...]
     }
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(SOCIALS_API_URL) as response:
-                if response.status != 200:
-                    logger.error(f"獲取額外頻道信息失敗: {response.status}")
-                    return {"high_freq": [], "low_freq": []}
-                
-                data = await response.json()
-                if data.get("code") != 200:
-                    logger.error("API返回錯誤狀態碼")
-                    return {"high_freq": [], "low_freq": []}
-                
-                high_freq_channels = []
-                low_freq_channels = []
-                
-                # 遍歷所有用戶的聊天組
-                for user_data in data.get("data", []):
-                    social_group = user_data.get("socialGroup")
-                    # 語言標準化：如 es_ES -> es；為空或 None 時使用 en
-                    raw_lang = user_data.get("lang")
-                    language = "en"
-                    if raw_lang:
-                        try:
-                            language_part = str(raw_lang).split("_")[0].lower()
-                            if language_part:
-                                language = language_part
-                        except Exception:
-                            language = "en"
-                    if not social_group:
-                        continue
-                        
-                    for chat in user_data.get("chats", []):
-                        if not chat.get("enable", False):
-                            continue
-                            
-                        chat_name = chat.get("name", "")
-                        chat_id = chat.get("chatId")
-                        
-                        if "WEB3 Signal - High Freq" in chat_name:
-                            high_freq_channels.append({
-                                "group_id": social_group,
-                                "topic_id": chat_id,
-                                "language": language
-                            })
-                        elif "WEB3 Signal – Low Freq" in chat_name:
-                            low_freq_channels.append({
-                                "group_id": social_group,
-                                "topic_id": chat_id,
-                                "language": language
-                            })
-                
-                return {
-                    "high_freq": high_freq_channels,
-                    "low_freq": low_freq_channels
-                }
+        return await channel_directory.get()
     except Exception as e:
         logger.error(f"獲取額外頻道信息時發生錯誤: {e}")
-        return {"high_freq": [], "low_freq": []} 
\ No newline at end of file
+        return _empty_channels()